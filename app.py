@@ -1,41 +1,77 @@
 
+import time
+
+# Marcado antes de qualquer import para que a partida a frio inclua o carregamento dos módulos.
+_INICIO_EXECUCAO = time.perf_counter()
+
 import base64
+import io
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Callable
 
 import numpy as np
 import streamlit as st
 
 from methods.gaussian import (
     GaussianEliminationError,
-    eliminacao_gauss_pivoteamento_parcial,
+    carregar_traco,
+    gravar_traco,
     ler_matriz,
     ler_vetor,
     matriz_aumentada_para_str,
+    passos_do_traco,
+    resolver_incremental,
+)
+from methods.root_finding import (
+    METODOS_PORTFOLIO,
+    RootFindingError,
+    coeficientes_polinomio,
+    construir_derivada,
+    construir_funcao,
+    falsa_posicao,
+    horner,
+    newton,
+    portfolio,
+    raizes_polinomio,
+    secante,
+    steffensen,
 )
-from methods.root_finding import RootFindingError, construir_funcao, falsa_posicao, secante
 
-LOGO_PATH = Path(__file__).resolve().parent / "Images" / "logo.png"
-LOGO_BASE64 = base64.b64encode(LOGO_PATH.read_bytes()).decode("utf-8")
+logger = logging.getLogger(__name__)
+
+# Acima deste tempo a primeira execução de um processo novo é registrada como lenta.
+LIMITE_PARTIDA_A_FRIO_MS = 1500.0
+# Intervalo entre as consultas ao andamento de um cálculo em segundo plano.
+INTERVALO_CONSULTA_S = 0.3
+# Quantidade de passos da eliminação renderizados por página.
+PASSOS_POR_PAGINA = 20
 
-st.set_page_config(
-    page_title="Hub de Métodos Numéricos",
-    page_icon=f"data:image/png;base64,{LOGO_BASE64}",
-    layout="centered",
-)
 BASE_DIR = Path(__file__).resolve().parent
 IMAGENS_DIR = BASE_DIR / "Images"
 
 
+@st.cache_data(show_spinner=False)
 def _imagem_base64(path: Path) -> str:
     with path.open("rb") as imagem:
         return base64.b64encode(imagem.read()).decode("utf-8")
 
 
+st.set_page_config(
+    page_title="Hub de Métodos Numéricos",
+    page_icon=f"data:image/png;base64,{_imagem_base64(IMAGENS_DIR / 'logo.png')}",
+    layout="centered",
+)
+
+
 THEMES = {
     "Eliminação de Gauss (Pivoteamento Parcial)": {
         "nome": "Dr. Facilier",
         "slogan": "Truques sombrios para dominar sistemas lineares.",
-        "imagem": _imagem_base64(IMAGENS_DIR / "dr_facilier.png"),
+        "imagem_arquivo": "dr_facilier.png",
         "background": "linear-gradient(135deg, #090314 0%, #2C1157 45%, #05020B 100%)",
         "texto": "#F8EAFF",
         "painel_bg": "rgba(28, 12, 54, 0.75)",
@@ -49,7 +85,7 @@ THEMES = {
     "Falsa Posição": {
         "nome": "Scar",
         "slogan": "Astúcia felina para encontrar raízes com segurança.",
-        "imagem": _imagem_base64(IMAGENS_DIR / "scar_vilao.png"),
+        "imagem_arquivo": "scar_vilao.png",
         "background": "linear-gradient(135deg, #0C1404 0%, #3A1E07 40%, #060B04 100%)",
         "texto": "#FDE68A",
         "painel_bg": "rgba(32, 39, 15, 0.75)",
@@ -63,7 +99,7 @@ THEMES = {
     "Secante": {
         "nome": "Úrsula",
         "slogan": "Conduza as ondas numéricas com o poder da secante.",
-        "imagem": _imagem_base64(IMAGENS_DIR / "ursula_vilã.png"),
+        "imagem_arquivo": "ursula_vilã.png",
         "background": "linear-gradient(135deg, #050823 0%, #311B6B 45%, #040619 100%)",
         "texto": "#E0E9FF",
         "painel_bg": "rgba(21, 25, 68, 0.75)",
@@ -74,6 +110,34 @@ THEMES = {
         "entrada_bg": "rgba(13, 16, 41, 0.55)",
         "entrada_borda": "rgba(168, 85, 247, 0.45)",
     },
+    "Newton e Steffensen": {
+        "nome": "Conselho dos Vilões",
+        "slogan": "Derivadas exatas conjuradas a partir da própria expressão.",
+        "imagem_arquivo": "logo.png",
+        "background": "linear-gradient(135deg, #0A0418 0%, #3B1466 45%, #07030F 100%)",
+        "texto": "#F3E8FF",
+        "painel_bg": "rgba(38, 16, 66, 0.75)",
+        "painel_borda": "rgba(234, 179, 8, 0.5)",
+        "painel_texto": "#F3E8FF",
+        "botao_bg": "#EAB308",
+        "botao_texto": "#1A0B2E",
+        "entrada_bg": "rgba(26, 11, 46, 0.55)",
+        "entrada_borda": "rgba(234, 179, 8, 0.45)",
+    },
+    "Portfólio de Métodos": {
+        "nome": "Corrida dos Vilões",
+        "slogan": "Todos os métodos disputam a raiz; o primeiro a convergir leva a coroa.",
+        "imagem_arquivo": "logo.png",
+        "background": "linear-gradient(135deg, #100312 0%, #4A1030 45%, #08020A 100%)",
+        "texto": "#FFE4F1",
+        "painel_bg": "rgba(58, 14, 40, 0.75)",
+        "painel_borda": "rgba(244, 114, 182, 0.5)",
+        "painel_texto": "#FFE4F1",
+        "botao_bg": "#F472B6",
+        "botao_texto": "#1F0614",
+        "entrada_bg": "rgba(40, 9, 28, 0.55)",
+        "entrada_borda": "rgba(244, 114, 182, 0.45)",
+    },
 }
 
 
@@ -220,6 +284,34 @@ div[data-testid="stDataFrame"] * {
 st.markdown(BASE_STYLE, unsafe_allow_html=True)
 
 
+def carregar_tema(metodo: str) -> dict:
+    """Completa o tema do método selecionado com a imagem codificada (sob demanda)."""
+    config = dict(THEMES[metodo])
+    config["imagem"] = _imagem_base64(IMAGENS_DIR / config["imagem_arquivo"])
+    return config
+
+
+@st.cache_resource
+def _metricas_inicializacao() -> dict:
+    """Métricas compartilhadas pelo processo; o primeiro registro é a partida a frio."""
+    return {}
+
+
+def registrar_tempo_inicializacao() -> None:
+    duracao_ms = (time.perf_counter() - _INICIO_EXECUCAO) * 1000.0
+    metricas = _metricas_inicializacao()
+    if "partida_a_frio_ms" not in metricas:
+        metricas["partida_a_frio_ms"] = duracao_ms
+        nivel = logging.WARNING if duracao_ms > LIMITE_PARTIDA_A_FRIO_MS else logging.INFO
+        logger.log(nivel, "Partida a frio do app: %.1f ms", duracao_ms)
+    st.session_state.setdefault("primeira_execucao_ms", duracao_ms)
+    st.sidebar.caption(
+        f"Partida a frio: {metricas['partida_a_frio_ms']:.0f} ms · "
+        f"esta sessão: {st.session_state['primeira_execucao_ms']:.0f} ms · "
+        f"esta execução: {duracao_ms:.0f} ms"
+    )
+
+
 def aplicar_tema(config: dict) -> None:
     st.markdown(
         f"""
@@ -240,6 +332,191 @@ def aplicar_tema(config: dict) -> None:
         unsafe_allow_html=True,
     )
 
+@st.cache_resource
+def _executor() -> ThreadPoolExecutor:
+    """Pool de threads do processo que executa os cálculos fora do ciclo de renderização."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="calculo")
+
+
+class _TarefaCancelada(Exception):
+    """Interrompe um cálculo em segundo plano substituído por outro da mesma página."""
+
+
+def iniciar_tarefa(pagina: str, funcao, *args) -> None:
+    """Agenda ``funcao(progresso, cancelar, *args)`` em segundo plano para a página da sessão.
+
+    Se a última tarefa da página já foi criada com os mesmos argumentos (em
+    andamento ou concluída), ela é reaproveitada em vez de recalculada; caso
+    contrário, ela é cancelada: ``cancelar`` é sinalizado para que um cálculo já
+    em execução pare na próxima avaliação e libere o pool compartilhado.
+    """
+    tarefas = st.session_state.setdefault("tarefas", {})
+    atual = tarefas.get(pagina)
+    if atual is not None:
+        if atual["argumentos"] == args and not atual["cancelar"].is_set():
+            return
+        atual["cancelar"].set()
+        atual["futuro"].cancel()
+    progresso: dict = {}
+    cancelar = threading.Event()
+    tarefas[pagina] = {
+        "argumentos": args,
+        "progresso": progresso,
+        "cancelar": cancelar,
+        "inicio": time.perf_counter(),
+        "futuro": _executor().submit(funcao, progresso, cancelar, *args),
+    }
+
+
+def acompanhar_tarefa(pagina: str, exibir: Callable[[Future], None]) -> None:
+    """Exibe o andamento da tarefa da página e, quando ela termina, ``exibir(futuro)``.
+
+    O bloco roda como fragmento: enquanto a tarefa está em andamento, só ele é
+    reexecutado a cada ``INTERVALO_CONSULTA_S`` segundos, sem reenviar o resto da
+    página. Ao concluir, uma execução completa desliga a consulta periódica.
+    """
+    tarefa = st.session_state.get("tarefas", {}).get(pagina)
+    if tarefa is None:
+        return
+    em_andamento = not tarefa["futuro"].done()
+
+    def _fragmento() -> None:
+        tarefa = st.session_state["tarefas"][pagina]
+        futuro = tarefa["futuro"]
+        if futuro.done():
+            if em_andamento:
+                st.rerun()
+            exibir(futuro)
+            return
+
+        decorrido = time.perf_counter() - tarefa["inicio"]
+        progresso = tarefa["progresso"]
+        if progresso.get("total"):
+            fracao = min(1.0, progresso["avaliacoes"] / progresso["total"])
+            st.progress(
+                fracao,
+                text=(
+                    f"Calculando em segundo plano… {progresso['avaliacoes']} "
+                    f"{progresso.get('unidade', 'avaliação(ões) de f(x)')}, {decorrido:.1f} s"
+                ),
+            )
+        else:
+            st.info(f"Calculando em segundo plano… {decorrido:.1f} s")
+
+    st.fragment(_fragmento, run_every=INTERVALO_CONSULTA_S if em_andamento else None)()
+
+
+def _contar_colunas(progresso: dict, cancelar: threading.Event, total: int):
+    """Callback ``ao_avancar`` da eliminação: atualiza o progresso e respeita o cancelamento."""
+    progresso.update({"avaliacoes": 0, "total": total, "unidade": f"de {total} coluna(s) de pivô"})
+
+    def _avancar(coluna: int) -> None:
+        if cancelar.is_set():
+            raise _TarefaCancelada
+        progresso["avaliacoes"] = coluna + 1
+
+    return _avancar
+
+
+def _contar_avaliacoes(progresso: dict, cancelar: threading.Event, f, total: int):
+    """Envolve ``f`` para que cada avaliação atualize o progresso e respeite o cancelamento."""
+    progresso.update({"avaliacoes": 0, "total": total})
+
+    def _f(x):
+        if cancelar.is_set():
+            raise _TarefaCancelada
+        progresso["avaliacoes"] += 1
+        return f(x)
+
+    return _f
+
+
+def _tarefa_gauss(
+    cache: dict, progresso: dict, cancelar: threading.Event, A_text: str, b_text: str, mostrar_passos: bool
+):
+    """Resolve o sistema.
+
+    Com passo a passo, grava o traço compacto da eliminação (renderizado por
+    páginas e oferecido para download); sem ele, reaproveita a fatoração LU
+    guardada em ``cache``.
+    """
+    A = ler_matriz(A_text)
+    b = ler_vetor(b_text)
+    if cancelar.is_set():
+        raise _TarefaCancelada
+    saida = {"A": A, "b": b, "traco": None, "arquivo": None, "incremental": None}
+    if mostrar_passos:
+        arquivo = io.BytesIO()
+        resumo = gravar_traco(A, b, arquivo, ao_avancar=_contar_colunas(progresso, cancelar, A.shape[0]))
+        if cancelar.is_set():
+            raise _TarefaCancelada
+        saida.update(
+            traco=carregar_traco(io.BytesIO(arquivo.getvalue())),
+            arquivo=arquivo.getvalue(),
+            x=resumo["x"],
+            trocas=resumo["trocas"],
+            ok=resumo["ok"],
+        )
+    else:
+        x, cache["fatoracao"], incremental = resolver_incremental(
+            A, b, cache.get("fatoracao"), ao_avancar=_contar_colunas(progresso, cancelar, A.shape[0])
+        )
+        saida.update(x=x, trocas=cache["fatoracao"]["trocas"], ok=True, incremental=incremental)
+    return saida
+
+
+def _tarefa_falsa_posicao(
+    progresso: dict, cancelar: threading.Event, expr: str, a: float, b: float, tol: float, max_iter: int
+):
+    f = _contar_avaliacoes(progresso, cancelar, construir_funcao(expr), max_iter + 2)
+    return falsa_posicao(f, a, b, tol, max_iter)
+
+
+def _tarefa_secante(
+    progresso: dict, cancelar: threading.Event, expr: str, x0: float, x1: float, tol: float, max_iter: int
+):
+    f = _contar_avaliacoes(progresso, cancelar, construir_funcao(expr), max_iter + 2)
+    return secante(f, x0, x1, tol, max_iter)
+
+
+def _tarefa_newton(
+    progresso: dict,
+    cancelar: threading.Event,
+    variante: str,
+    expr: str,
+    x0: float,
+    tol: float,
+    max_iter: int,
+    todas_raizes: bool,
+):
+    if variante.startswith("Newton"):
+        f_df = _contar_avaliacoes(progresso, cancelar, construir_derivada(expr), max_iter + 1)
+        result = newton(f_df, x0, tol, max_iter)
+    else:
+        f = _contar_avaliacoes(progresso, cancelar, construir_funcao(expr), 2 * max_iter + 1)
+        result = steffensen(f, x0, tol, max_iter)
+
+    saida = {"variante": variante, "resultado": result, "todas_raizes": todas_raizes, "coeficientes": None}
+    if todas_raizes:
+        saida["coeficientes"] = coeficientes_polinomio(expr)
+        if saida["coeficientes"] is not None:
+            saida["raizes"] = raizes_polinomio(saida["coeficientes"])
+    return saida
+
+
+def _tarefa_portfolio(
+    progresso: dict,
+    cancelar: threading.Event,
+    expr: str,
+    a: float,
+    b: float,
+    tol: float,
+    max_iter: int,
+    metodos: tuple,
+):
+    return portfolio(expr, a, b, tol, max_iter, metodos, interromper=cancelar)
+
+
 st.title("🧮 Hub de Métodos Numéricos")
 st.caption("Escolha um método para resolver seu problema.")
 
@@ -267,6 +544,15 @@ def render_eliminacao_gauss(tema: dict) -> None:
         precision = st.slider(
             "Precisão de exibição (casas decimais)", 0, 10, 6, key="gauss_precision"
         )
+        mostrar_passos = st.checkbox(
+            "Exibir passo a passo",
+            value=True,
+            key="gauss_passos",
+            help=(
+                "Desmarque para resolver pela fatoração LU da sessão: após pequenas edições em A "
+                "(uma linha ou coluna), a solução é atualizada em O(n²) em vez de refeita."
+            ),
+        )
 
     col1, col2 = st.columns(2)
     with col1:
@@ -285,15 +571,40 @@ def render_eliminacao_gauss(tema: dict) -> None:
         )
 
     if st.button("Calcular sistema", type="primary"):
+        cache = st.session_state.setdefault("gauss_fatoracao", {})
+        iniciar_tarefa("gauss", partial(_tarefa_gauss, cache), A_text, b_text, mostrar_passos)
+
+    def _exibir(tarefa: Future) -> None:
         try:
-            A = ler_matriz(A_text)
-            b = ler_vetor(b_text)
-            passos, _, _, x, swaps, ok = eliminacao_gauss_pivoteamento_parcial(A, b)
+            saida = tarefa.result()
+            A, b, x, swaps, ok = saida["A"], saida["b"], saida["x"], saida["trocas"], saida["ok"]
+            incremental = saida["incremental"]
 
             st.subheader("Matriz Aumentada Inicial [A | b]")
             st.code(matriz_aumentada_para_str(A, b, precisao=precision), language="text")
 
-            st.subheader("Passo a passo")
+            passos = []
+            if saida["traco"] is not None:
+                total = saida["traco"]["codigos"].size
+                paginas = max(1, -(-total // PASSOS_POR_PAGINA))
+                if st.session_state.get("gauss_pagina", 1) > paginas:
+                    st.session_state["gauss_pagina"] = 1
+                st.subheader("Passo a passo")
+                col_pagina, col_download = st.columns([1, 1])
+                with col_pagina:
+                    pagina = st.number_input(
+                        f"Página (de {paginas})", min_value=1, max_value=paginas, key="gauss_pagina"
+                    )
+                with col_download:
+                    st.download_button(
+                        "Baixar traço completo (.npz)",
+                        data=saida["arquivo"],
+                        file_name="traco_eliminacao.npz",
+                        mime="application/octet-stream",
+                    )
+                inicio = (int(pagina) - 1) * PASSOS_POR_PAGINA
+                passos = passos_do_traco(saida["traco"], inicio, inicio + PASSOS_POR_PAGINA)
+                st.caption(f"Passos {inicio + 1}–{inicio + len(passos)} de {total}.")
             for s in passos:
                 with st.container():
                     st.markdown(f"**{s['titulo']}**")
@@ -306,7 +617,20 @@ def render_eliminacao_gauss(tema: dict) -> None:
                     )
 
             if ok and x is not None:
-                st.success(f"Solução encontrada (com {swaps} troca(s) de linha):")
+                if incremental is None:
+                    st.success(f"Solução encontrada (com {swaps} troca(s) de linha):")
+                elif incremental["modo"] == "atualizacao":
+                    st.success(
+                        f"Solução encontrada atualizando a fatoração LU anterior "
+                        f"(alteração de posto {incremental['posto']}, custo O(n²)):"
+                    )
+                elif incremental["modo"] == "reuso":
+                    st.success("Solução encontrada reaproveitando a fatoração LU anterior (A não mudou):")
+                else:
+                    st.success(
+                        f"Solução encontrada com nova fatoração LU ({incremental['motivo']}; "
+                        f"{swaps} troca(s) de linha):"
+                    )
                 st.write(x)
                 st.caption("Vetor solução x.")
                 st.subheader("Verificação (A·x ≈ b)")
@@ -325,14 +649,21 @@ def render_eliminacao_gauss(tema: dict) -> None:
         except Exception as exc:
             st.exception(exc)
 
+    acompanhar_tarefa("gauss", _exibir)
+
     with st.expander("Como usar"):
         st.markdown(
-            """
+            f"""
             - Digite **A** com N linhas e N colunas; use espaços ou vírgulas.
             - Digite **b** com N números (uma linha).
             - Clique em **Calcular sistema**. O app fará pivoteamento parcial em cada coluna,
               mostrando trocas de linha, fatores de eliminação e a matriz aumentada a cada passo.
             - Ao final, é feita a retrossubstituição e a verificação `A·x ≈ b`.
+            - Os passos são exibidos em páginas de {PASSOS_POR_PAGINA}; o traço completo pode ser
+              baixado como `.npz` (matriz inicial e operações, lidos com `carregar_traco`).
+            - Para sistemas grandes editados aos poucos, desmarque **Exibir passo a passo** em
+              Configurações: a fatoração LU fica guardada na sessão e edições de poucas linhas ou
+              colunas de A são resolvidas por atualização de baixo posto (Sherman–Morrison–Woodbury).
             """
         )
 
@@ -372,9 +703,13 @@ def render_falsa_posicao(tema: dict) -> None:
         )
 
     if st.button("Calcular raiz (falsa posição)", type="primary"):
+        iniciar_tarefa(
+            "falsa_posicao", _tarefa_falsa_posicao, expr, float(a), float(b), tol or 1e-12, int(max_iter)
+        )
+
+    def _exibir(tarefa: Future) -> None:
         try:
-            f = construir_funcao(expr)
-            result = falsa_posicao(f, float(a), float(b), tol or 1e-12, int(max_iter))
+            result = tarefa.result()
             passos = result.get("passos", [])
 
             if passos:
@@ -406,6 +741,8 @@ def render_falsa_posicao(tema: dict) -> None:
         except Exception as exc:
             st.exception(exc)
 
+    acompanhar_tarefa("falsa_posicao", _exibir)
+
     with st.expander("Dicas"):
         st.markdown(
             """
@@ -453,9 +790,13 @@ def render_secante(tema: dict) -> None:
         )
 
     if st.button("Calcular raiz (secante)", type="primary"):
+        iniciar_tarefa(
+            "secante", _tarefa_secante, expr, float(x0), float(x1), tol or 1e-12, int(max_iter)
+        )
+
+    def _exibir(tarefa: Future) -> None:
         try:
-            f = construir_funcao(expr)
-            result = secante(f, float(x0), float(x1), tol or 1e-12, int(max_iter))
+            result = tarefa.result()
             passos = result.get("passos", [])
 
             if passos:
@@ -487,6 +828,8 @@ def render_secante(tema: dict) -> None:
         except Exception as exc:
             st.exception(exc)
 
+    acompanhar_tarefa("secante", _exibir)
+
     with st.expander("Dicas"):
         st.markdown(
             """
@@ -496,6 +839,245 @@ def render_secante(tema: dict) -> None:
             """
         )
 
+def render_newton(tema: dict) -> None:
+    st.subheader("Métodos de Newton e Steffensen")
+    st.caption(
+        "Informe f(x) e uma aproximação inicial. A derivada é obtida automaticamente a partir da expressão."
+    )
+
+    st.markdown(
+        f"""
+        <div class="tema-hero">
+            <span class="tema-hero__badge">Tema: {tema['nome']}</span>
+            <img src="data:image/png;base64,{tema['imagem']}" alt="{tema['nome']}">
+            <div class="tema-hero__slogan">{tema['slogan']}</div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    expr = st.text_input("Função f(x)", value="x**3 - x - 2", key="nw_expr")
+    metodo = st.radio(
+        "Variante",
+        ("Newton (derivada automática)", "Steffensen (sem derivada)"),
+        horizontal=True,
+        key="nw_metodo",
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        x0 = st.number_input("x₀", value=1.5, key="nw_x0")
+        tol = st.number_input(
+            "Tolerância (ε)", value=1e-6, format="%.1e", min_value=0.0, key="nw_tol"
+        )
+    with col2:
+        max_iter = st.number_input(
+            "Máximo de iterações",
+            min_value=1,
+            max_value=500,
+            value=50,
+            step=1,
+            key="nw_max_iter",
+        )
+    todas_raizes = st.checkbox(
+        "Listar todas as raízes reais e complexas (somente polinômios)", key="nw_todas_raizes"
+    )
+
+    if st.button("Calcular raiz (Newton/Steffensen)", type="primary"):
+        iniciar_tarefa(
+            "newton",
+            _tarefa_newton,
+            metodo,
+            expr,
+            float(x0),
+            tol or 1e-12,
+            int(max_iter),
+            todas_raizes,
+        )
+
+    def _exibir(tarefa: Future) -> None:
+        try:
+            saida = tarefa.result()
+            result = saida["resultado"]
+            if saida["variante"].startswith("Newton"):
+                table = [
+                    {
+                        "Iteração": s["iteracao"],
+                        "Passo": s["metodo"],
+                        "xₙ": s["x_atual"],
+                        "f(xₙ)": s["fx_atual"],
+                        "f'(xₙ)": s["dfx"],
+                        "xₙ₊₁": s["x_proximo"],
+                        "f(xₙ₊₁)": s["fx"],
+                        "Erro": s["erro"],
+                    }
+                    for s in result.get("passos", [])
+                ]
+            else:
+                table = [
+                    {
+                        "Iteração": s["iteracao"],
+                        "xₙ": s["x_atual"],
+                        "f(xₙ)": s["fx_atual"],
+                        "Inclinação": s["inclinacao"],
+                        "xₙ₊₁": s["x_proximo"],
+                        "f(xₙ₊₁)": s["fx"],
+                        "Erro": s["erro"],
+                    }
+                    for s in result.get("passos", [])
+                ]
+
+            if table:
+                st.dataframe(table, use_container_width=True)
+
+            if result.get("sucesso"):
+                st.success(
+                    f"Raiz aproximada: {result['raiz']:.6g} (|f(x)| = {abs(result['fx']):.2e})"
+                )
+            else:
+                st.warning(result.get("mensagem", "Método não convergiu."))
+                st.info(
+                    f"Melhor aproximação encontrada: {result['raiz']:.6g} (|f(x)| = {abs(result['fx']):.2e})"
+                )
+
+            if saida["todas_raizes"]:
+                coeficientes = saida["coeficientes"]
+                if coeficientes is None:
+                    st.info("A expressão não é um polinômio em x; use apenas +, −, ·, / por constante e potências inteiras.")
+                else:
+                    st.subheader("Todas as raízes (matriz companheira)")
+                    st.dataframe(
+                        [
+                            {
+                                "Parte real": z.real,
+                                "Parte imaginária": z.imag,
+                                "|p(z)|": abs(horner(coeficientes, z)),
+                            }
+                            for z in saida["raizes"]
+                        ],
+                        use_container_width=True,
+                    )
+
+        except RootFindingError as exc:
+            st.error(str(exc))
+        except Exception as exc:
+            st.exception(exc)
+
+    acompanhar_tarefa("newton", _exibir)
+
+    with st.expander("Dicas"):
+        st.markdown(
+            """
+            - Newton converge quadraticamente perto de raízes simples; a derivada é calculada
+              exatamente com números duais, sem precisar digitar f'(x).
+            - Quando f'(x) ≈ 0, o passo de Newton é substituído por um passo da secante.
+            - Steffensen também converge quadraticamente e dispensa derivadas, mas é mais sensível
+              à escolha de x₀.
+            - Funções chamadas via `math.` não propagam derivadas; prefira `sin(x)` ou `np.sin(x)`.
+            - Para polinômios, marque a opção de listar todas as raízes: elas vêm dos autovalores
+              da matriz companheira, refinados com alguns passos de Newton.
+            """
+        )
+
+def render_portfolio(tema: dict) -> None:
+    st.subheader("Portfólio de Métodos")
+    st.caption(
+        "Informe f(x) e um intervalo [a, b]. Os métodos selecionados correm em paralelo e o primeiro a convergir vence."
+    )
+
+    st.markdown(
+        f"""
+        <div class="tema-hero">
+            <span class="tema-hero__badge">Tema: {tema['nome']}</span>
+            <img src="data:image/png;base64,{tema['imagem']}" alt="{tema['nome']}">
+            <div class="tema-hero__slogan">{tema['slogan']}</div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    expr = st.text_input("Função f(x)", value="x**3 - x - 2", key="pf_expr")
+    metodos = st.multiselect(
+        "Métodos na disputa", METODOS_PORTFOLIO, default=list(METODOS_PORTFOLIO), key="pf_metodos"
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        a = st.number_input("Limite inferior (a)", value=1.0, key="pf_a")
+        tol = st.number_input(
+            "Tolerância (ε)", value=1e-6, format="%.1e", min_value=0.0, key="pf_tol"
+        )
+    with col2:
+        b = st.number_input("Limite superior (b)", value=2.0, key="pf_b")
+        max_iter = st.number_input(
+            "Máximo de iterações",
+            min_value=1,
+            max_value=500,
+            value=50,
+            step=1,
+            key="pf_max_iter",
+        )
+
+    if st.button("Calcular raiz (portfólio)", type="primary"):
+        iniciar_tarefa(
+            "portfolio",
+            _tarefa_portfolio,
+            expr,
+            float(a),
+            float(b),
+            tol or 1e-12,
+            int(max_iter),
+            tuple(metodos),
+        )
+
+    def _exibir(tarefa: Future) -> None:
+        try:
+            result = tarefa.result()
+
+            if result.get("sucesso"):
+                st.success(
+                    f"Vencedor: {result['metodo']} — raiz aproximada {result['raiz']:.6g} "
+                    f"(|f(x)| = {abs(result['fx']):.2e}) em {result['iteracoes']} iteração(ões)"
+                )
+            else:
+                st.warning(result.get("mensagem", "Método não convergiu."))
+                st.info(
+                    f"Melhor aproximação ({result['metodo']}): {result['raiz']:.6g} (|f(x)| = {abs(result['fx']):.2e})"
+                )
+            st.caption(f"Avaliações de f(x) somando todos os métodos: {result['avaliacoes']}.")
+
+            st.dataframe(
+                [
+                    {
+                        "Método": metodo,
+                        "Desfecho": desfecho,
+                        "Avaliações": result["avaliacoes_por_metodo"].get(metodo, 0),
+                    }
+                    for metodo, desfecho in result["tentativas"].items()
+                ],
+                use_container_width=True,
+            )
+            if result.get("passos"):
+                st.subheader(f"Passos do método vencedor ({result['metodo']})")
+                st.dataframe(result["passos"], use_container_width=True)
+
+        except RootFindingError as exc:
+            st.error(str(exc))
+        except Exception as exc:
+            st.exception(exc)
+
+    acompanhar_tarefa("portfolio", _exibir)
+
+    with st.expander("Dicas"):
+        st.markdown(
+            """
+            - Falsa posição e secante partem de a e b; Newton e Steffensen partem do ponto médio.
+            - Os métodos compartilham um cache de avaliações de f(x); os que ainda estiverem
+              rodando quando um deles convergir são cancelados.
+            - Útil quando não se sabe de antemão qual método se comporta melhor para a função.
+            """
+        )
+
 st.sidebar.header("Métodos disponíveis")
 
 
@@ -505,6 +1087,8 @@ selected_method = st.sidebar.radio(
         "Eliminação de Gauss (Pivoteamento Parcial)",
         "Falsa Posição",
         "Secante",
+        "Newton e Steffensen",
+        "Portfólio de Métodos",
     ),
 )
 
@@ -512,8 +1096,14 @@ _RENDERERS = {
     "Eliminação de Gauss (Pivoteamento Parcial)": render_eliminacao_gauss,
     "Falsa Posição": render_falsa_posicao,
     "Secante": render_secante,
+    "Newton e Steffensen": render_newton,
+    "Portfólio de Métodos": render_portfolio,
 }
 
-tema_atual = THEMES[selected_method]
+tema_atual = carregar_tema(selected_method)
 aplicar_tema(tema_atual)
-_RENDERERS[selected_method](tema_atual)
+try:
+    _RENDERERS[selected_method](tema_atual)
+finally:
+    # Também na execução interrompida por st.rerun() quando um cálculo em segundo plano termina.
+    registrar_tempo_inicializacao()
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import Callable
+
 import numpy as np
 
 
@@ -58,108 +62,426 @@ def matriz_aumentada_para_str(A: np.ndarray, b: np.ndarray, precisao: int = 6) -
     return "\n".join(out)
 
 
-def eliminacao_gauss_pivoteamento_parcial(
-    A_in: np.ndarray,
-    b_in: np.ndarray,
-    tol: float = 1e-12,
-):
-    """Executa eliminação de Gauss com pivoteamento parcial."""
-    if A_in.ndim != 2 or A_in.shape[0] != A_in.shape[1]:
-        raise GaussianEliminationError("A deve ser uma matriz quadrada (NxN).")
-    if b_in.ndim != 1 or b_in.shape[0] != A_in.shape[0]:
-        raise GaussianEliminationError("b deve ter N elementos (mesmo N de linhas de A).")
+TIPOS_SUPORTADOS = (np.dtype(np.float32), np.dtype(np.float64), np.dtype(np.complex128))
 
-    A = A_in.astype(float).copy()
-    b = b_in.astype(float).copy()
-    n = A.shape[0]
-    passos = []
-    swaps = 0
 
+def _tipo_de_trabalho(*arrays: np.ndarray) -> np.dtype:
+    """Escolhe o dtype da eliminação sem promover float32/complex128 desnecessariamente."""
+    dtype = np.result_type(*arrays)
+    if dtype in TIPOS_SUPORTADOS:
+        return dtype
+    return np.dtype(np.complex128) if dtype.kind == "c" else np.dtype(np.float64)
+
+
+def _buffer_de_trabalho(arr: np.ndarray, dtype: np.dtype, sobrescrever: bool, nome: str) -> np.ndarray:
+    if not sobrescrever:
+        return arr.astype(dtype)
+    if arr.dtype != dtype or not arr.flags.writeable:
+        raise GaussianEliminationError(
+            f"overwrite_{nome} exige um array gravável no dtype de trabalho {dtype} "
+            f"(recebido {arr.dtype}); converta A e b para o mesmo dtype antes de chamar."
+        )
+    return arr
+
+
+# Códigos das operações da eliminação; cada operação é (código, linha, coluna, valor).
+OP_PIVO_NULO = 0
+OP_TROCA = 1
+OP_PIVO_MANTIDO = 2
+OP_ELIMINACAO = 3
+OP_JA_ZERO = 4
+OP_RETRO_NULO = 5
+OP_RETRO = 6
+
+# Limite de instantâneos de [A|b] mantidos em memória por ``carregar_traco``.
+CHECKPOINTS_MAXIMOS = 32
+
+
+def _eliminar(A: np.ndarray, b: np.ndarray, x: np.ndarray, tol: float):
+    """Escalona A e b (e preenche x) no lugar, gerando cada operação logo após aplicá-la."""
+    n = A.shape[0]
     for k in range(n - 1):
         pivot_row = k + np.argmax(np.abs(A[k:, k]))
         pivot_val = A[pivot_row, k]
 
         if abs(pivot_val) < tol:
-            passos.append(
-                {
-                    "titulo": f"Coluna {k + 1}: pivô numérico nulo",
-                    "descricao": (
-                        "<span class='warn'>Pivô ≈ 0</span>. O sistema pode ser singular ou mal condicionado. "
-                        "A execução foi interrompida."
-                    ),
-                    "A": A.copy(),
-                    "b": b.copy(),
-                }
-            )
-            return passos, None, None, None, swaps, False
+            yield OP_PIVO_NULO, k, k, pivot_val
+            return
 
         if pivot_row != k:
             A[[k, pivot_row]] = A[[pivot_row, k]]
             b[[k, pivot_row]] = b[[pivot_row, k]]
-            swaps += 1
-            passos.append(
-                {
-                    "titulo": f"Troca de linhas L{k + 1} ↔ L{pivot_row + 1} (pivoteamento parcial)",
-                    "descricao": f"Pivô escolhido: |a[{pivot_row + 1},{k + 1}]| = {abs(pivot_val):.6g}.",
-                    "A": A.copy(),
-                    "b": b.copy(),
-                }
-            )
+            yield OP_TROCA, k, pivot_row, pivot_val
         else:
-            passos.append(
-                {
-                    "titulo": f"Coluna {k + 1}: pivô a[{k + 1},{k + 1}] = {pivot_val:.6g} (já é o maior)",
-                    "descricao": "Nenhuma troca necessária.",
-                    "A": A.copy(),
-                    "b": b.copy(),
-                }
-            )
+            yield OP_PIVO_MANTIDO, k, k, pivot_val
 
         for i in range(k + 1, n):
             m = A[i, k] / A[k, k]
             if abs(m) > tol:
-                A[i, k:] = A[i, k:] - m * A[k, k:]
-                b[i] = b[i] - m * b[k]
-                passos.append(
-                    {
-                        "titulo": f"L{i + 1} ← L{i + 1} − ({m:.6g})·L{k + 1}",
-                        "descricao": "Zerando entradas abaixo do pivô.",
-                        "A": A.copy(),
-                        "b": b.copy(),
-                    }
-                )
+                A[i, k:] -= m * A[k, k:]
+                b[i] -= m * b[k]
+                yield OP_ELIMINACAO, i, k, m
             else:
-                passos.append(
-                    {
-                        "titulo": f"Entrada a[{i + 1},{k + 1}] já é ≈ 0 (m = {m:.2e})",
-                        "descricao": "Nenhuma alteração necessária nesta linha.",
-                        "A": A.copy(),
-                        "b": b.copy(),
-                    }
-                )
-
-    x = np.zeros(n, dtype=float)
+                yield OP_JA_ZERO, i, k, m
+
     for i in range(n - 1, -1, -1):
         if abs(A[i, i]) < tol:
-            passos.append(
-                {
-                    "titulo": f"Retrossubstituição: pivô na linha {i + 1} é ≈ 0",
-                    "descricao": "<span class='warn'>Sistema singular ou indefinido.</span>",
-                    "A": A.copy(),
-                    "b": b.copy(),
-                }
-            )
-            return passos, A, b, None, swaps, False
+            yield OP_RETRO_NULO, i, i, A[i, i]
+            return
         s = b[i] - np.dot(A[i, i + 1 :], x[i + 1 :])
         x[i] = s / A[i, i]
-        passos.append(
-            {
-                "titulo": f"Retrossubstituição na linha {i + 1}",
-                "descricao": (
-                    f"x[{i + 1}] = (b[{i + 1}] − Σ a[{i + 1},j]·x[j]) / a[{i + 1},{i + 1}] = {x[i]:.6g}"
-                ),
-                "A": A.copy(),
-                "b": b.copy(),
-            }
+        yield OP_RETRO, i, i, x[i]
+
+
+def _reaplicar(A: np.ndarray, b: np.ndarray, codigo: int, linha: int, coluna: int, valor) -> None:
+    """Repete sobre A e b o efeito de uma operação já registrada."""
+    if codigo == OP_TROCA:
+        A[[linha, coluna]] = A[[coluna, linha]]
+        b[[linha, coluna]] = b[[coluna, linha]]
+    elif codigo == OP_ELIMINACAO:
+        A[linha, coluna:] -= valor * A[coluna, coluna:]
+        b[linha] -= valor * b[coluna]
+
+
+def _descrever(codigo: int, linha: int, coluna: int, valor):
+    """Título e descrição exibidos para uma operação da eliminação."""
+    if codigo == OP_PIVO_NULO:
+        return (
+            f"Coluna {coluna + 1}: pivô numérico nulo",
+            "<span class='warn'>Pivô ≈ 0</span>. O sistema pode ser singular ou mal condicionado. "
+            "A execução foi interrompida.",
+        )
+    if codigo == OP_TROCA:
+        return (
+            f"Troca de linhas L{linha + 1} ↔ L{coluna + 1} (pivoteamento parcial)",
+            f"Pivô escolhido: |a[{coluna + 1},{linha + 1}]| = {abs(valor):.6g}.",
+        )
+    if codigo == OP_PIVO_MANTIDO:
+        return (
+            f"Coluna {coluna + 1}: pivô a[{coluna + 1},{coluna + 1}] = {valor:.6g} (já é o maior)",
+            "Nenhuma troca necessária.",
+        )
+    if codigo == OP_ELIMINACAO:
+        return (
+            f"L{linha + 1} ← L{linha + 1} − ({valor:.6g})·L{coluna + 1}",
+            "Zerando entradas abaixo do pivô.",
         )
+    if codigo == OP_JA_ZERO:
+        return (
+            f"Entrada a[{linha + 1},{coluna + 1}] já é ≈ 0 (m = {valor:.2e})",
+            "Nenhuma alteração necessária nesta linha.",
+        )
+    if codigo == OP_RETRO_NULO:
+        return (
+            f"Retrossubstituição: pivô na linha {linha + 1} é ≈ 0",
+            "<span class='warn'>Sistema singular ou indefinido.</span>",
+        )
+    return (
+        f"Retrossubstituição na linha {linha + 1}",
+        f"x[{linha + 1}] = (b[{linha + 1}] − Σ a[{linha + 1},j]·x[j]) / a[{linha + 1},{linha + 1}] = {valor:.6g}",
+    )
+
+
+def eliminacao_gauss_pivoteamento_parcial(
+    A_in: np.ndarray,
+    b_in: np.ndarray,
+    tol: float = 1e-12,
+    overwrite_a: bool = False,
+    overwrite_b: bool = False,
+    out: np.ndarray | None = None,
+    registrar_passos: bool = True,
+):
+    """Executa eliminação de Gauss com pivoteamento parcial.
+
+    Com ``overwrite_a``/``overwrite_b`` a eliminação é feita diretamente nos
+    buffers do chamador, e ``out`` recebe a solução. O buffer precisa estar no
+    dtype de trabalho (o de A e b juntos): um float32 acompanhado de um float64
+    seria promovido e copiado, então levanta ``GaussianEliminationError``.
+    float32, float64 e complex128 são preservados; outros tipos são convertidos
+    para float64 (ou complex128). Por padrão ``registrar_passos=True`` copia A e
+    b a cada passo, o que anula a economia de ``overwrite_a``; use
+    ``registrar_passos=False`` para não alocar por passo.
+    """
+    if A_in.ndim != 2 or A_in.shape[0] != A_in.shape[1]:
+        raise GaussianEliminationError("A deve ser uma matriz quadrada (NxN).")
+    if b_in.ndim != 1 or b_in.shape[0] != A_in.shape[0]:
+        raise GaussianEliminationError("b deve ter N elementos (mesmo N de linhas de A).")
+
+    dtype = _tipo_de_trabalho(A_in, b_in)
+    A = _buffer_de_trabalho(A_in, dtype, overwrite_a, "a")
+    b = _buffer_de_trabalho(b_in, dtype, overwrite_b, "b")
+    n = A.shape[0]
+    if out is not None and (out.shape != (n,) or out.dtype != dtype):
+        raise GaussianEliminationError(
+            f"out deve ser um vetor de {n} elementos com dtype {dtype} (recebido {out.shape}, {out.dtype})."
+        )
+    x = out if out is not None else np.zeros(n, dtype=dtype)
+    passos = []
+    swaps = 0
+
+    for op in _eliminar(A, b, x, tol):
+        if op[0] == OP_TROCA:
+            swaps += 1
+        if registrar_passos:
+            titulo, descricao = _descrever(*op)
+            passos.append({"titulo": titulo, "descricao": descricao, "A": A.copy(), "b": b.copy()})
+        if op[0] == OP_PIVO_NULO:
+            return passos, None, None, None, swaps, False
+        if op[0] == OP_RETRO_NULO:
+            return passos, A, b, None, swaps, False
     return passos, A, b, x, swaps, True
+
+
+def gravar_traco(
+    A_in: np.ndarray,
+    b_in: np.ndarray,
+    destino,
+    tol: float = 1e-12,
+    ao_avancar: Callable[[int], None] | None = None,
+) -> dict:
+    """Executa a eliminação e grava o traço compacto em um ``.npz`` comprimido.
+
+    Em vez de uma cópia de [A|b] por passo, o arquivo guarda só a matriz inicial
+    e as operações (código, linha, coluna, valor), ocupando O(n²). ``destino``
+    pode ser um caminho ou um arquivo binário aberto. ``ao_avancar(k)`` é chamada
+    a cada coluna de pivô k; uma exceção levantada por ela interrompe a
+    eliminação. Devolve o resumo da execução.
+    """
+    if A_in.ndim != 2 or A_in.shape[0] != A_in.shape[1]:
+        raise GaussianEliminationError("A deve ser uma matriz quadrada (NxN).")
+    if b_in.ndim != 1 or b_in.shape[0] != A_in.shape[0]:
+        raise GaussianEliminationError("b deve ter N elementos (mesmo N de linhas de A).")
+    dtype = _tipo_de_trabalho(A_in, b_in)
+    A = A_in.astype(dtype)
+    b = b_in.astype(dtype)
+    x = np.zeros(A.shape[0], dtype=dtype)
+
+    codigos, linhas, colunas, valores = [], [], [], []
+    for op in _eliminar(A, b, x, tol):
+        if ao_avancar is not None and op[0] in (OP_TROCA, OP_PIVO_MANTIDO):
+            ao_avancar(op[1])
+        codigos.append(op[0])
+        linhas.append(op[1])
+        colunas.append(op[2])
+        valores.append(op[3])
+
+    ok = not codigos or codigos[-1] not in (OP_PIVO_NULO, OP_RETRO_NULO)
+    trocas = codigos.count(OP_TROCA)
+    np.savez_compressed(
+        destino,
+        A=A_in.astype(dtype),
+        b=b_in.astype(dtype),
+        codigos=np.array(codigos, dtype=np.int8),
+        linhas=np.array(linhas, dtype=np.int32),
+        colunas=np.array(colunas, dtype=np.int32),
+        valores=np.array(valores, dtype=dtype),
+        x=x if ok else np.zeros(0, dtype=dtype),
+        trocas=np.array(trocas),
+    )
+    return {"total_passos": len(codigos), "x": x if ok else None, "trocas": trocas, "ok": ok}
+
+
+def carregar_traco(origem, intervalo_checkpoint: int | None = None) -> dict:
+    """Lê para a memória um traço gravado por ``gravar_traco``.
+
+    Reaplica as operações uma vez e guarda instantâneos de [A|b] a cada
+    ``intervalo_checkpoint`` operações (por padrão 4·n, limitado a
+    ``CHECKPOINTS_MAXIMOS`` instantâneos), a partir dos quais
+    ``passos_do_traco`` reconstrói qualquer trecho.
+    """
+    with np.load(origem) as dados:
+        traco = {nome: dados[nome] for nome in dados.files if not nome.startswith("checkpoints")}
+
+    A = traco["A"].copy()
+    b = traco["b"].copy()
+    n = A.shape[0]
+    total = traco["codigos"].size
+    if intervalo_checkpoint is None:
+        intervalo_checkpoint = max(4 * n, -(-total // CHECKPOINTS_MAXIMOS), 1)
+    checkpoints, checkpoints_A, checkpoints_b = [], [], []
+    for j in range(total):
+        op = (int(traco["codigos"][j]), int(traco["linhas"][j]), int(traco["colunas"][j]), traco["valores"][j])
+        _reaplicar(A, b, *op)
+        if (j + 1) % intervalo_checkpoint == 0:
+            checkpoints.append(j + 1)
+            checkpoints_A.append(A.copy())
+            checkpoints_b.append(b.copy())
+    traco.update(
+        checkpoints=np.array(checkpoints, dtype=np.int64),
+        checkpoints_A=np.array(checkpoints_A, dtype=A.dtype).reshape(-1, n, n),
+        checkpoints_b=np.array(checkpoints_b, dtype=b.dtype).reshape(-1, n),
+    )
+    return traco
+
+
+def passos_do_traco(traco: dict, inicio: int, fim: int) -> list:
+    """Reconstrói os passos ``[inicio, fim)`` no formato de ``eliminacao_gauss_pivoteamento_parcial``.
+
+    A reconstrução parte do último instantâneo anterior a ``inicio`` e reaplica
+    apenas as operações necessárias, sem percorrer o traço inteiro.
+    """
+    total = traco["codigos"].size
+    inicio, fim = max(0, inicio), min(fim, total)
+    base = np.searchsorted(traco["checkpoints"], inicio, side="right") - 1
+    if base >= 0:
+        posicao = int(traco["checkpoints"][base])
+        A = traco["checkpoints_A"][base].copy()
+        b = traco["checkpoints_b"][base].copy()
+    else:
+        posicao = 0
+        A = traco["A"].copy()
+        b = traco["b"].copy()
+
+    passos = []
+    for j in range(posicao, fim):
+        op = (
+            int(traco["codigos"][j]),
+            int(traco["linhas"][j]),
+            int(traco["colunas"][j]),
+            traco["valores"][j],
+        )
+        _reaplicar(A, b, *op)
+        if j >= inicio:
+            titulo, descricao = _descrever(*op)
+            passos.append({"titulo": titulo, "descricao": descricao, "A": A.copy(), "b": b.copy()})
+    return passos
+
+
+def fatoracao_lu(
+    A_in: np.ndarray, tol: float = 1e-12, ao_avancar: Callable[[int], None] | None = None
+) -> dict:
+    """Fatora PA = LU com pivoteamento parcial, guardando L e U compactados em uma matriz.
+
+    ``ao_avancar(k)``, se dada, é chamada antes de cada coluna de pivô k.
+    """
+    if A_in.ndim != 2 or A_in.shape[0] != A_in.shape[1]:
+        raise GaussianEliminationError("A deve ser uma matriz quadrada (NxN).")
+    LU = A_in.astype(_tipo_de_trabalho(A_in))
+    n = LU.shape[0]
+    perm = np.arange(n)
+    trocas = 0
+
+    for k in range(n):
+        if ao_avancar is not None:
+            ao_avancar(k)
+        pivot_row = k + np.argmax(np.abs(LU[k:, k]))
+        if abs(LU[pivot_row, k]) < tol:
+            raise GaussianEliminationError(
+                f"Pivô ≈ 0 na coluna {k + 1}: o sistema pode ser singular ou mal condicionado."
+            )
+        if pivot_row != k:
+            LU[[k, pivot_row]] = LU[[pivot_row, k]]
+            perm[[k, pivot_row]] = perm[[pivot_row, k]]
+            trocas += 1
+        LU[k + 1 :, k] /= LU[k, k]
+        LU[k + 1 :, k + 1 :] -= np.outer(LU[k + 1 :, k], LU[k, k + 1 :])
+
+    return {"A": A_in.astype(LU.dtype), "LU": LU, "perm": perm, "trocas": trocas}
+
+
+def resolver_lu(fatoracao: dict, b: np.ndarray) -> np.ndarray:
+    """Resolve A·x = b em O(n²) a partir de ``fatoracao_lu``; b pode ter várias colunas."""
+    LU = fatoracao["LU"]
+    n = LU.shape[0]
+    y = b[fatoracao["perm"]].astype(_tipo_de_trabalho(LU, b))
+    for i in range(1, n):
+        y[i] -= LU[i, :i] @ y[:i]
+    for i in range(n - 1, -1, -1):
+        y[i] = (y[i] - LU[i, i + 1 :] @ y[i + 1 :]) / LU[i, i]
+    return y
+
+
+# Acima destes limites a atualização de baixo posto é descartada e A é refatorada.
+COND_MAXIMA_ATUALIZACAO = 1e8
+# O resíduo relativo aceito é eps ** EXPOENTE_RESIDUO_ATUALIZACAO do dtype menos preciso
+# (≈1.5e-8 em float64, ≈3.5e-4 em float32): ao menos metade dos dígitos disponíveis.
+EXPOENTE_RESIDUO_ATUALIZACAO = 0.5
+
+
+def _decompor_alteracao(delta: np.ndarray, mascara: np.ndarray):
+    """Escreve ΔA = U·Vᵀ cobrindo as entradas alteradas com o menor número de linhas/colunas.
+
+    Compara três coberturas: só linhas, só colunas, e as linhas com mais de uma
+    entrada alterada somadas às colunas que cobrem o restante (o caso "editei
+    uma linha e uma coluna").
+    """
+    n = delta.shape[0]
+    identidade = np.eye(n, dtype=delta.dtype)
+    linhas = np.flatnonzero(mascara.any(axis=1))
+    colunas = np.flatnonzero(mascara.any(axis=0))
+    linhas_densas = np.flatnonzero(mascara.sum(axis=1) > 1)
+    resto = delta.copy()
+    resto[linhas_densas, :] = 0
+    colunas_resto = np.flatnonzero((resto != 0).any(axis=0))
+
+    menor = min(linhas.size, colunas.size, linhas_densas.size + colunas_resto.size)
+    if linhas.size == menor:
+        return identidade[:, linhas], delta[linhas, :]
+    if colunas.size == menor:
+        return delta[:, colunas], identidade[colunas, :]
+    U = np.hstack([identidade[:, linhas_densas], resto[:, colunas_resto]])
+    Vt = np.vstack([delta[linhas_densas, :], identidade[colunas_resto, :]])
+    return U, Vt
+
+
+def resolver_incremental(
+    A: np.ndarray,
+    b: np.ndarray,
+    fatoracao: dict | None = None,
+    max_posto: int | None = None,
+    tol: float = 1e-12,
+    ao_avancar: Callable[[int], None] | None = None,
+):
+    """Resolve A·x = b reaproveitando a fatoração de uma matriz anterior.
+
+    Se A difere da matriz fatorada em poucas linhas ou colunas (posto até
+    ``max_posto``, por padrão ~n/10), a solução sai pela fórmula de
+    Sherman–Morrison–Woodbury em O(k·n²). Quando a matriz de capacitância é
+    mal condicionada ou o resíduo final não é pequeno, A é refatorada.
+    Devolve ``(x, fatoracao, info)``; ``info["modo"]`` indica o caminho usado.
+    ``ao_avancar`` é repassada a ``fatoracao_lu`` quando A precisa ser refatorada.
+    """
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise GaussianEliminationError("A deve ser uma matriz quadrada (NxN).")
+    if b.ndim != 1 or b.shape[0] != A.shape[0]:
+        raise GaussianEliminationError("b deve ter N elementos (mesmo N de linhas de A).")
+    n = A.shape[0]
+    if max_posto is None:
+        max_posto = max(1, n // 10)
+
+    def _refatorar(motivo: str):
+        nova = fatoracao_lu(A, tol, ao_avancar)
+        return resolver_lu(nova, b), nova, {"modo": "refatoracao", "posto": None, "motivo": motivo}
+
+    if fatoracao is None or fatoracao["A"].shape != A.shape:
+        return _refatorar("sem fatoração anterior compatível")
+
+    delta = A - fatoracao["A"]
+    mascara = delta != 0
+    y = resolver_lu(fatoracao, b)
+    if not mascara.any():
+        return y, fatoracao, {"modo": "reuso", "posto": 0, "motivo": "A não mudou"}
+
+    U, Vt = _decompor_alteracao(delta, mascara)
+    posto = U.shape[1]
+    if posto > max_posto:
+        return _refatorar(f"alteração de posto {posto} > {max_posto}")
+
+    Z = resolver_lu(fatoracao, U)
+    capacitancia = np.eye(posto, dtype=Z.dtype) + Vt @ Z
+    # Compara o menor valor singular de I + VᵀZ com a escala das parcelas somadas:
+    # cancelamento ali significa que A ficou (quase) singular ou que a fórmula perde dígitos.
+    escala = 1.0 + np.linalg.norm(Vt, 2) * np.linalg.norm(Z, 2)
+    if not np.isfinite(capacitancia).all():
+        return _refatorar("atualização numericamente instável (capacitância não finita)")
+    valores_singulares = np.linalg.svd(capacitancia, compute_uv=False)
+    if valores_singulares[-1] * COND_MAXIMA_ATUALIZACAO < max(valores_singulares[0], escala):
+        return _refatorar("atualização numericamente instável (capacitância mal condicionada)")
+
+    x = y - Z @ np.linalg.solve(capacitancia, Vt @ y)
+    residuo = np.linalg.norm(A @ x - b) / (np.linalg.norm(A) * np.linalg.norm(x) + np.linalg.norm(b))
+    eps = max(np.finfo(fatoracao["LU"].dtype).eps, np.finfo(_tipo_de_trabalho(A, b)).eps)
+    if not np.isfinite(residuo) or residuo > eps**EXPOENTE_RESIDUO_ATUALIZACAO:
+        return _refatorar(f"resíduo da atualização alto ({residuo:.1e})")
+
+    return x, fatoracao, {"modo": "atualizacao", "posto": posto, "motivo": None}
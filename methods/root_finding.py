@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import ast
 import math
-from typing import Callable, Dict, List
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from types import CodeType
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 
@@ -10,25 +15,415 @@ class RootFindingError(Exception):
     """Erro disparado quando não é possível iniciar a busca pela raiz."""
 
 
-_ALLOWED_NAMES = {name: getattr(math, name) for name in dir(math) if not name.startswith("_")}
-_ALLOWED_NAMES.update({name: getattr(np, name) for name in dir(np) if not name.startswith("_")})
-_ALLOWED_NAMES.update({"np": np, "math": math})
+_AUSENTE = object()
 
 
-def construir_funcao(expr: str) -> Callable[[float], float]:
-    """Cria uma função f(x) a partir de uma expressão em texto."""
+# As chaves são nomes digitados pelos usuários; o limite evita crescimento sem fim no servidor.
+@lru_cache(maxsize=1024)
+def _resolver_nome(nome: str) -> object:
+    """Resolve um nome permitido em expressões (NumPy tem precedência sobre ``math``)."""
+    if nome == "np":
+        return np
+    if nome == "math":
+        return math
+    if nome.startswith("_"):
+        return _AUSENTE
+    for modulo in (np, math):
+        valor = getattr(modulo, nome, _AUSENTE)
+        if valor is not _AUSENTE:
+            return valor
+    return _AUSENTE
+
+
+def _nomes_usados(code: CodeType) -> Set[str]:
+    nomes = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            nomes |= _nomes_usados(const)
+    return nomes
+
+
+def _ambiente(code: CodeType) -> Dict[str, object]:
+    """Monta o namespace apenas com os nomes que a expressão compilada realmente usa."""
+    env = {}
+    for nome in _nomes_usados(code):
+        valor = _resolver_nome(nome)
+        if valor is not _AUSENTE:
+            env[nome] = valor
+    return env
+
+# Grau acima do qual a expansão simbólica deixa de compensar (limita só o custo, não a precisão).
+_GRAU_MAXIMO = 100
+
+
+def _coeficientes_no(node: ast.AST) -> Optional[List[float]]:
+    """Expande um nó da AST em coeficientes (do grau 0 para cima), ou ``None``."""
+    if isinstance(node, ast.Expression):
+        return _coeficientes_no(node.body)
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return [float(node.value)]
+        return None
+    if isinstance(node, ast.Name):
+        if node.id == "x":
+            return [0.0, 1.0]
+        valor = _resolver_nome(node.id)
+        if isinstance(valor, float):
+            return [valor]
+        return None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        operando = _coeficientes_no(node.operand)
+        if operando is None:
+            return None
+        return operando if isinstance(node.op, ast.UAdd) else [-c for c in operando]
+    if not isinstance(node, ast.BinOp):
+        return None
+
+    esquerda = _coeficientes_no(node.left)
+    direita = _coeficientes_no(node.right)
+    if esquerda is None or direita is None:
+        return None
+
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        sinal = 1.0 if isinstance(node.op, ast.Add) else -1.0
+        out = [0.0] * max(len(esquerda), len(direita))
+        for i, c in enumerate(esquerda):
+            out[i] += c
+        for i, c in enumerate(direita):
+            out[i] += sinal * c
+        return out
+    if isinstance(node.op, ast.Mult):
+        if len(esquerda) + len(direita) - 2 > _GRAU_MAXIMO:
+            return None
+        out = [0.0] * (len(esquerda) + len(direita) - 1)
+        for i, a in enumerate(esquerda):
+            for j, b in enumerate(direita):
+                out[i + j] += a * b
+        return out
+    if isinstance(node.op, ast.Div) and len(direita) == 1 and direita[0] != 0:
+        return [c / direita[0] for c in esquerda]
+    if isinstance(node.op, ast.Pow) and len(direita) == 1:
+        expoente = direita[0]
+        if expoente < 0 or expoente != int(expoente):
+            return None
+        if len(esquerda) == 1:
+            return [esquerda[0] ** expoente]
+        if (len(esquerda) - 1) * int(expoente) > _GRAU_MAXIMO:
+            return None
+        out = [1.0]
+        for _ in range(int(expoente)):
+            out = [
+                sum(out[k] * esquerda[i - k] for k in range(len(out)) if 0 <= i - k < len(esquerda))
+                for i in range(len(out) + len(esquerda) - 1)
+            ]
+        return out
+    return None
+
+
+def _constante(node: ast.AST) -> bool:
+    coeficientes = _coeficientes_no(node)
+    return coeficientes is not None and len(coeficientes) == 1
+
+
+def _monomio(node: ast.AST) -> bool:
+    """``c``, ``x``, ``x**k`` ou um desses multiplicado/dividido por constantes."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        return _monomio(node.operand)
+    if isinstance(node, ast.Name) and node.id == "x":
+        return True
+    if not isinstance(node, ast.BinOp):
+        return _constante(node)
+    if isinstance(node.op, ast.Pow):
+        return (isinstance(node.left, ast.Name) and node.left.id == "x" and _constante(node.right)) or _constante(
+            node
+        )
+    if isinstance(node.op, ast.Mult):
+        return (_constante(node.left) and _monomio(node.right)) or (_monomio(node.left) and _constante(node.right))
+    if isinstance(node.op, ast.Div):
+        return _monomio(node.left) and _constante(node.right)
+    return _constante(node)
+
+
+def _soma_de_monômios(node: ast.AST) -> bool:
+    """Indica se a expressão já está escrita como soma de monômios.
+
+    Formas fatoradas, como ``(x - 10)**20``, expandidas em coeficientes perdem
+    precisão por cancelamento; nelas Horner não reproduz o ``eval``.
+    """
+    if isinstance(node, ast.Expression):
+        return _soma_de_monômios(node.body)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        return _soma_de_monômios(node.left) and _soma_de_monômios(node.right)
+    return _monomio(node)
+
+
+def _coeficientes_para_horner(expr: str, parametros: Tuple[str, ...]) -> Optional[np.ndarray]:
+    """Coeficientes de f(x) quando é seguro avaliá-la por Horner, ou ``None``."""
+    if parametros:
+        return None
+    try:
+        arvore = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        return None
+    if not _soma_de_monômios(arvore):
+        return None
+    return coeficientes_polinomio(expr)
+
+
+def coeficientes_polinomio(expr: str) -> Optional[np.ndarray]:
+    """Extrai os coeficientes de f(x) (maior grau primeiro) se a expressão for um polinômio."""
+    try:
+        coeficientes = _coeficientes_no(ast.parse(expr, mode="eval"))
+    except (SyntaxError, OverflowError, RecursionError):
+        return None
+    if coeficientes is None:
+        return None
+    coeficientes = np.trim_zeros(np.array(coeficientes[::-1], dtype=float), "f")
+    return coeficientes if coeficientes.size else np.zeros(1)
+
+
+def horner(coeficientes: np.ndarray, x):
+    """Avalia o polinômio pelo método de Horner; aceita escalares e arrays de x."""
+    resultado = np.zeros_like(x, dtype=np.result_type(x, coeficientes)) if np.ndim(x) else 0.0
+    for c in coeficientes:
+        resultado = resultado * x + c
+    return resultado
+
+
+def _horner_escalar(coeficientes: List[float], x: float) -> float:
+    """Horner em floats do Python: bem mais rápido que escalares NumPy para x escalar."""
+    resultado = 0.0
+    for c in coeficientes:
+        resultado = resultado * x + c
+    return resultado
+
+
+def _validar_parametros(parametros: Sequence[str]) -> Tuple[str, ...]:
+    parametros = tuple(parametros)
+    for nome in parametros:
+        if not nome.isidentifier() or nome == "x" or nome.startswith("_"):
+            raise RootFindingError(f"Nome de parâmetro inválido: {nome!r}.")
+    return parametros
+
+
+def construir_funcao(expr: str, parametros: Sequence[str] = ()) -> Callable[..., float]:
+    """Cria uma função f(x) a partir de uma expressão em texto.
+
+    Polinômios escritos como soma de monômios são reconhecidos na análise e
+    avaliados por Horner; seus coeficientes ficam disponíveis em ``f.coeficientes``
+    (``None`` caso contrário, inclusive em formas fatoradas, avaliadas por ``eval``).
+    Com ``parametros``, a função devolvida é ``f(x, *valores)``, na ordem dos nomes.
+    """
     if not expr or not expr.strip():
         raise RootFindingError("Informe uma expressão para f(x).")
+    parametros = _validar_parametros(parametros)
     code = compile(expr, "<expr>", "eval")
+    coeficientes = _coeficientes_para_horner(expr, parametros)
+
+    if coeficientes is not None:
+        lista = coeficientes.tolist()
+
+        def _f(x):
+            if isinstance(x, np.ndarray):
+                return horner(coeficientes, x)
+            return _horner_escalar(lista, float(x))
+
+    else:
+        env = _ambiente(code)
 
-    def _f(x: float) -> float:
-        local_env = dict(_ALLOWED_NAMES)
-        local_env.update({"x": x})
-        return float(eval(code, {"__builtins__": {}}, local_env))
+        def _f(x: float, *valores: float) -> float:
+            local_env = dict(env)
+            local_env.update(zip(parametros, valores))
+            local_env.update({"x": x})
+            return float(eval(code, {"__builtins__": {}}, local_env))
 
+    _f.coeficientes = coeficientes
     return _f
 
 
+class Dual:
+    """Número dual ``valor + derivada·ε`` (com ε² = 0) para diferenciação automática."""
+
+    __slots__ = ("valor", "derivada")
+
+    def __init__(self, valor: float, derivada: float = 0.0) -> None:
+        self.valor = valor
+        self.derivada = derivada
+
+    def __repr__(self) -> str:
+        return f"Dual({self.valor!r}, {self.derivada!r})"
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.valor + other.valor, self.derivada + other.derivada)
+        return Dual(self.valor + other, self.derivada)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.valor - other.valor, self.derivada - other.derivada)
+        return Dual(self.valor - other, self.derivada)
+
+    def __rsub__(self, other):
+        return Dual(other - self.valor, -self.derivada)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(
+                self.valor * other.valor,
+                self.derivada * other.valor + self.valor * other.derivada,
+            )
+        return Dual(self.valor * other, self.derivada * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(
+                self.valor / other.valor,
+                (self.derivada * other.valor - self.valor * other.derivada) / other.valor**2,
+            )
+        return Dual(self.valor / other, self.derivada / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.valor, -other * self.derivada / self.valor**2)
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            valor = self.valor**other.valor
+            return Dual(
+                valor,
+                valor
+                * (
+                    other.derivada * math.log(self.valor)
+                    + other.valor * self.derivada / self.valor
+                ),
+            )
+        if other == 0:
+            return Dual(1.0, 0.0)
+        return Dual(self.valor**other, other * self.valor ** (other - 1) * self.derivada)
+
+    def __rpow__(self, other):
+        valor = other**self.valor
+        return Dual(valor, valor * math.log(other) * self.derivada)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        sinal = 1.0 if self.valor >= 0 else -1.0
+        return Dual(abs(self.valor), sinal * self.derivada)
+
+
+# Pares (função, derivada) usados para propagar ε através das funções elementares.
+_REGRAS_DUAIS: Dict[str, Tuple[Callable[[float], float], Callable[[float], float]]] = {
+    "sin": (math.sin, math.cos),
+    "cos": (math.cos, lambda v: -math.sin(v)),
+    "tan": (math.tan, lambda v: 1.0 / math.cos(v) ** 2),
+    "asin": (math.asin, lambda v: 1.0 / math.sqrt(1.0 - v * v)),
+    "acos": (math.acos, lambda v: -1.0 / math.sqrt(1.0 - v * v)),
+    "atan": (math.atan, lambda v: 1.0 / (1.0 + v * v)),
+    "sinh": (math.sinh, math.cosh),
+    "cosh": (math.cosh, math.sinh),
+    "tanh": (math.tanh, lambda v: 1.0 - math.tanh(v) ** 2),
+    "exp": (math.exp, math.exp),
+    "log": (math.log, lambda v: 1.0 / v),
+    "log10": (math.log10, lambda v: 1.0 / (v * math.log(10.0))),
+    "log2": (math.log2, lambda v: 1.0 / (v * math.log(2.0))),
+    "sqrt": (math.sqrt, lambda v: 0.5 / math.sqrt(v)),
+    "fabs": (math.fabs, lambda v: 1.0 if v >= 0 else -1.0),
+}
+_APELIDOS_DUAIS = {
+    "arcsin": "asin",
+    "arccos": "acos",
+    "arctan": "atan",
+    "absolute": "fabs",
+    "abs": "fabs",
+}
+
+
+def _funcao_dual(nome: str) -> Callable:
+    funcao, derivada = _REGRAS_DUAIS[nome]
+
+    def _g(x, *args):
+        if isinstance(x, Dual):
+            if nome == "log" and args:
+                return _g(x) / math.log(args[0])
+            return Dual(funcao(x.valor), derivada(x.valor) * x.derivada)
+        original = _resolver_nome(nome)
+        return (funcao if original is _AUSENTE else original)(x, *args)
+
+    return _g
+
+
+_FUNCOES_DUAIS = {nome: _funcao_dual(nome) for nome in _REGRAS_DUAIS}
+_FUNCOES_DUAIS.update({apelido: _FUNCOES_DUAIS[nome] for apelido, nome in _APELIDOS_DUAIS.items()})
+
+# Os ufuncs do NumPy (np.sin, np.exp, ...) delegam para métodos homônimos quando
+# recebem objetos, então expor as regras como métodos cobre também a sintaxe ``np.*``.
+for _nome, _g in _FUNCOES_DUAIS.items():
+    if _nome != "abs":
+        setattr(Dual, _nome, lambda self, _g=_g: _g(self))
+
+
+def construir_derivada(
+    expr: str, parametros: Sequence[str] = ()
+) -> Callable[..., Tuple[float, float]]:
+    """Cria uma função que devolve ``(f(x), f'(x))`` por diferenciação automática.
+
+    Com ``parametros``, a função devolvida é ``f_df(x, *valores)``; a derivada é
+    sempre em relação a x.
+    """
+    if not expr or not expr.strip():
+        raise RootFindingError("Informe uma expressão para f(x).")
+    parametros = _validar_parametros(parametros)
+    code = compile(expr, "<expr>", "eval")
+    coeficientes = _coeficientes_para_horner(expr, parametros)
+
+    if coeficientes is not None:
+        lista = coeficientes.tolist()
+        derivada = (np.polyder(coeficientes) if coeficientes.size > 1 else np.zeros(1)).tolist()
+
+        def _fdf_polinomio(x: float) -> Tuple[float, float]:
+            x = float(x)
+            return _horner_escalar(lista, x), _horner_escalar(derivada, x)
+
+        return _fdf_polinomio
+
+    env = _ambiente(code)
+    env.update({nome: _FUNCOES_DUAIS[nome] for nome in _nomes_usados(code) if nome in _FUNCOES_DUAIS})
+
+    def _fdf(x: float, *valores: float) -> Tuple[float, float]:
+        local_env = dict(env)
+        local_env.update(zip(parametros, valores))
+        local_env.update({"x": Dual(float(x), 1.0)})
+        try:
+            valor = eval(code, {"__builtins__": {}}, local_env)
+        except (TypeError, AttributeError) as exc:
+            raise RootFindingError(
+                f"A expressão usa uma operação sem suporte à derivação automática ({exc})."
+            ) from exc
+        except (ValueError, ZeroDivisionError, OverflowError) as exc:
+            raise RootFindingError(
+                f"f(x) ou f'(x) indefinida em x = {float(x):.6g} ({exc})."
+            ) from exc
+        try:
+            if isinstance(valor, Dual):
+                return float(valor.valor), float(valor.derivada)
+            return float(valor), 0.0
+        except (TypeError, ValueError) as exc:
+            # Potência fracionária de base negativa, por exemplo, produz um complexo.
+            raise RootFindingError(
+                f"f(x) ou f'(x) não é real em x = {float(x):.6g} ({exc})."
+            ) from exc
+
+    return _fdf
+
+
 def falsa_posicao(
     f: Callable[[float], float],
     a: float,
@@ -172,3 +567,454 @@ def secante(
         "passos": passos,
         "mensagem": "Número máximo de iterações atingido sem convergência ao critério de tolerância.",
     }
+
+
+# Limiar abaixo do qual f'(x) é considerada nula e o passo de Newton vira secante.
+_DERIVADA_MINIMA = 1e-12
+
+
+def newton(
+    f_df: Callable[[float], Tuple[float, float]],
+    x0: float,
+    tol: float = 1e-6,
+    max_iter: int = 50,
+) -> Dict[str, object]:
+    """Implementa o método de Newton com recuo para a secante quando f'(x) ≈ 0."""
+    x, (fx, dfx) = x0, f_df(x0)
+    if abs(fx) < tol:
+        return {
+            "sucesso": True,
+            "raiz": x,
+            "fx": fx,
+            "iteracoes": 0,
+            "passos": [],
+        }
+
+    passos: List[Dict[str, float]] = []
+    x_anterior = f_anterior = None
+
+    for iteration in range(1, max_iter + 1):
+        if abs(dfx) > _DERIVADA_MINIMA:
+            metodo = "Newton"
+            x_novo = x - fx / dfx
+        else:
+            metodo = "Secante"
+            if x_anterior is None:
+                x_anterior = x + 1e-4 * max(1.0, abs(x))
+                f_anterior, _ = f_df(x_anterior)
+            denom = fx - f_anterior
+            if abs(denom) < 1e-30:
+                raise RootFindingError(
+                    "Derivada nula e secante degenerada (f(xₙ) - f(xₙ₋₁) ≈ 0)."
+                )
+            x_novo = x - fx * (x - x_anterior) / denom
+        f_novo, df_novo = f_df(x_novo)
+        error = min(abs(f_novo), abs(x_novo - x))
+
+        passos.append(
+            {
+                "iteracao": iteration,
+                "metodo": metodo,
+                "x_atual": x,
+                "fx_atual": fx,
+                "dfx": dfx,
+                "x_proximo": x_novo,
+                "fx": f_novo,
+                "erro": error,
+            }
+        )
+
+        if abs(f_novo) < tol or abs(x_novo - x) < tol:
+            return {
+                "sucesso": True,
+                "raiz": x_novo,
+                "fx": f_novo,
+                "iteracoes": iteration,
+                "passos": passos,
+            }
+
+        x_anterior, f_anterior = x, fx
+        x, fx, dfx = x_novo, f_novo, df_novo
+
+    return {
+        "sucesso": False,
+        "raiz": x_novo,
+        "fx": f_novo,
+        "iteracoes": max_iter,
+        "passos": passos,
+        "mensagem": "Número máximo de iterações atingido sem convergência ao critério de tolerância.",
+    }
+
+
+def steffensen(
+    f: Callable[[float], float],
+    x0: float,
+    tol: float = 1e-6,
+    max_iter: int = 50,
+) -> Dict[str, object]:
+    """Implementa o método de Steffensen, de convergência quadrática e sem derivadas."""
+    x, fx = x0, f(x0)
+    if abs(fx) < tol:
+        return {
+            "sucesso": True,
+            "raiz": x,
+            "fx": fx,
+            "iteracoes": 0,
+            "passos": [],
+        }
+
+    passos: List[Dict[str, float]] = []
+
+    for iteration in range(1, max_iter + 1):
+        denom = f(x + fx) - fx
+        if abs(denom) < 1e-30:
+            raise RootFindingError("Divisão por zero encontrada (f(x + f(x)) - f(x) ≈ 0).")
+        x_novo = x - fx * fx / denom
+        f_novo = f(x_novo)
+        error = min(abs(f_novo), abs(x_novo - x))
+
+        passos.append(
+            {
+                "iteracao": iteration,
+                "x_atual": x,
+                "fx_atual": fx,
+                "inclinacao": denom / fx,
+                "x_proximo": x_novo,
+                "fx": f_novo,
+                "erro": error,
+            }
+        )
+
+        if abs(f_novo) < tol or abs(x_novo - x) < tol:
+            return {
+                "sucesso": True,
+                "raiz": x_novo,
+                "fx": f_novo,
+                "iteracoes": iteration,
+                "passos": passos,
+            }
+
+        x, fx = x_novo, f_novo
+
+    return {
+        "sucesso": False,
+        "raiz": x_novo,
+        "fx": f_novo,
+        "iteracoes": max_iter,
+        "passos": passos,
+        "mensagem": "Número máximo de iterações atingido sem convergência ao critério de tolerância.",
+    }
+
+
+def raizes_polinomio(coeficientes: np.ndarray, polimento: int = 3) -> np.ndarray:
+    """Calcula todas as raízes (reais e complexas) pelos autovalores da matriz companheira.
+
+    Cada autovalor é refinado com ``polimento`` passos de Newton sobre o polinômio
+    original, aceitos apenas quando reduzem |p(z)|.
+    """
+    coeficientes = np.trim_zeros(np.asarray(coeficientes, dtype=float), "f")
+    if coeficientes.size == 0:
+        raise RootFindingError("O polinômio identicamente nulo não tem raízes isoladas.")
+    grau = coeficientes.size - 1
+    if grau == 0:
+        return np.zeros(0, dtype=complex)
+
+    companheira = np.zeros((grau, grau))
+    companheira[0, :] = -coeficientes[1:] / coeficientes[0]
+    companheira[1:, :-1] = np.eye(grau - 1)
+    raizes = np.linalg.eigvals(companheira).astype(complex)
+
+    derivada = np.polyder(coeficientes)
+    for _ in range(polimento):
+        p = horner(coeficientes, raizes)
+        dp = horner(derivada, raizes)
+        passo = np.divide(p, dp, out=np.zeros_like(p), where=dp != 0)
+        candidatas = raizes - passo
+        melhorou = np.abs(horner(coeficientes, candidatas)) < np.abs(p)
+        raizes = np.where(melhorou, candidatas, raizes)
+
+    quase_reais = np.abs(raizes.imag) <= 1e-12 * np.maximum(1.0, np.abs(raizes))
+    raizes = np.where(quase_reais, raizes.real + 0j, raizes)
+    return raizes[np.lexsort((raizes.imag, raizes.real))]
+
+
+class _Cancelado(Exception):
+    """Interrompe um método do portfólio depois que outro já convergiu."""
+
+
+class _AvaliacoesCompartilhadas:
+    """Cache de f(x) e f'(x) compartilhado pelos métodos que correm no portfólio."""
+
+    def __init__(
+        self,
+        f: Callable[[float], float],
+        f_df: Callable[[float], Tuple[float, float]],
+        cancelar: threading.Event,
+        interromper: Optional[threading.Event] = None,
+    ) -> None:
+        self._f = f
+        self._f_df = f_df
+        self._cancelar = cancelar
+        self._interromper = interromper
+        self._lock = threading.Lock()
+        self._valores: Dict[float, float] = {}
+        self._derivadas: Dict[float, float] = {}
+        self.por_metodo: Dict[str, int] = {}
+
+    @property
+    def total(self) -> int:
+        return sum(self.por_metodo.values())
+
+    def _cancelado(self) -> bool:
+        return self._cancelar.is_set() or (self._interromper is not None and self._interromper.is_set())
+
+    def para(self, metodo: str) -> Tuple[Callable[[float], float], Callable[[float], Tuple[float, float]]]:
+        """Devolve ``(f, f_df)`` que contabilizam as avaliações reais em nome de ``metodo``."""
+        self.por_metodo.setdefault(metodo, 0)
+
+        def _f(x: float) -> float:
+            if self._cancelado():
+                raise _Cancelado
+            with self._lock:
+                if x in self._valores:
+                    return self._valores[x]
+            fx = self._f(x)
+            with self._lock:
+                self._valores[x] = fx
+                self.por_metodo[metodo] += 1
+            return fx
+
+        def _f_df(x: float) -> Tuple[float, float]:
+            if self._cancelado():
+                raise _Cancelado
+            with self._lock:
+                if x in self._derivadas:
+                    return self._valores[x], self._derivadas[x]
+            fx, dfx = self._f_df(x)
+            with self._lock:
+                self._valores[x] = fx
+                self._derivadas[x] = dfx
+                self.por_metodo[metodo] += 1
+            return fx, dfx
+
+        return _f, _f_df
+
+
+METODOS_PORTFOLIO = ("Falsa Posição", "Secante", "Newton", "Steffensen")
+
+# Pool do processo reaproveitado entre chamadas; as threads só são criadas sob demanda.
+_EXECUTOR_PORTFOLIO = ThreadPoolExecutor(max_workers=len(METODOS_PORTFOLIO), thread_name_prefix="portfolio")
+
+
+def portfolio(
+    expr: str,
+    a: float,
+    b: float,
+    tol: float = 1e-6,
+    max_iter: int = 50,
+    metodos: Sequence[str] = METODOS_PORTFOLIO,
+    interromper: Optional[threading.Event] = None,
+) -> Dict[str, object]:
+    """Corre vários métodos em paralelo sobre a mesma expressão e devolve o primeiro a convergir.
+
+    Falsa posição e secante partem de ``a`` e ``b``; Newton e Steffensen, do ponto
+    médio. Só vence quem termina com |f(x)| ≤ ``tol``; métodos que param apenas
+    por passo pequeno são registrados como estagnados. Entre métodos que
+    terminam na mesma consulta, vence o primeiro na ordem de ``metodos``; de
+    resto o vencedor depende de qual termina antes. O resultado tem o formato
+    de ``secante`` acrescido de ``metodo``
+    (vencedor), ``avaliacoes`` (avaliações reais de f somando todos os métodos),
+    ``avaliacoes_por_metodo`` e ``tentativas`` (desfecho de cada método).
+    Sinalizar ``interromper`` cancela todos os métodos e levanta ``RootFindingError``.
+    """
+    desconhecidos = [m for m in metodos if m not in METODOS_PORTFOLIO]
+    if not metodos or desconhecidos:
+        raise RootFindingError(
+            f"Escolha métodos entre: {', '.join(METODOS_PORTFOLIO)}."
+        )
+    f = construir_funcao(expr)
+    f_df = construir_derivada(expr)
+    cancelar = threading.Event()
+    avaliacoes = _AvaliacoesCompartilhadas(f, f_df, cancelar, interromper)
+    meio = 0.5 * (a + b)
+
+    def _executar(metodo: str) -> Dict[str, object]:
+        f_m, f_df_m = avaliacoes.para(metodo)
+        if metodo == "Falsa Posição":
+            return falsa_posicao(f_m, a, b, tol, max_iter)
+        if metodo == "Secante":
+            return secante(f_m, a, b, tol, max_iter)
+        if metodo == "Newton":
+            return newton(f_df_m, meio, tol, max_iter)
+        return steffensen(f_m, meio, tol, max_iter)
+
+    vencedor = None
+    concluidos: Dict[str, Dict[str, object]] = {}
+    tentativas: Dict[str, str] = {}
+
+    pendentes = {_EXECUTOR_PORTFOLIO.submit(_executar, metodo): metodo for metodo in metodos}
+    try:
+        while pendentes and vencedor is None:
+            prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in sorted(prontos, key=lambda f: metodos.index(pendentes[f])):
+                metodo = pendentes.pop(futuro)
+                try:
+                    resultado = futuro.result()
+                except Exception as exc:
+                    tentativas[metodo] = f"falhou: {exc}"
+                    continue
+                concluidos[metodo] = resultado
+                if not resultado.get("sucesso"):
+                    tentativas[metodo] = "não convergiu"
+                elif abs(resultado["fx"]) > tol:
+                    # Parou por passo pequeno, mas f(x) ainda está longe de zero.
+                    tentativas[metodo] = "estagnou"
+                elif vencedor is None:
+                    vencedor = metodo
+                    tentativas[metodo] = "venceu"
+                else:
+                    tentativas[metodo] = "convergiu depois do vencedor"
+    finally:
+        # Os perdedores param na próxima avaliação; esperar por eles libera o pool
+        # compartilhado e fecha a contagem de avaliações antes de devolver.
+        cancelar.set()
+        for futuro in pendentes:
+            futuro.cancel()
+        wait(pendentes)
+    for metodo in pendentes.values():
+        tentativas[metodo] = "cancelado"
+
+    if interromper is not None and interromper.is_set():
+        raise RootFindingError("Portfólio interrompido antes de terminar.")
+    if vencedor is None:
+        if not concluidos:
+            raise RootFindingError(
+                "Nenhum método do portfólio pôde ser executado: "
+                + "; ".join(f"{m} {tentativas[m]}" for m in metodos)
+            )
+        vencedor = min(concluidos, key=lambda m: abs(concluidos[m]["fx"]))
+        resultado = dict(concluidos[vencedor])
+        resultado["sucesso"] = False
+        resultado["mensagem"] = "Nenhum método convergiu; exibindo a melhor aproximação encontrada."
+    else:
+        resultado = dict(concluidos[vencedor])
+
+    resultado.update(
+        {
+            "metodo": vencedor,
+            "avaliacoes": avaliacoes.total,
+            "avaliacoes_por_metodo": dict(avaliacoes.por_metodo),
+            "tentativas": {m: tentativas[m] for m in metodos},
+        }
+    )
+    return resultado
+
+
+# Correção maior que este múltiplo do último passo da raiz indica troca de ramo.
+_SALTO_MAXIMO = 5.0
+# Erros do corretor tratados como falha de correção (ponto de retorno), e não como abortar a varredura.
+_FALHAS_DE_CORRECAO = (RootFindingError, ValueError, ZeroDivisionError, OverflowError, AttributeError)
+
+
+def varredura_parametro(
+    expr: str,
+    parametro: str,
+    valores: Sequence[float],
+    x0: float,
+    tol: float = 1e-6,
+    max_iter: int = 50,
+    intervalo: Optional[Tuple[float, float]] = None,
+) -> Dict[str, np.ndarray]:
+    """Acompanha a raiz de f(x; p) = 0 ao longo de ``valores`` do parâmetro (continuação).
+
+    Cada ponto parte de uma previsão extrapolada linearmente das duas raízes
+    anteriores e é corrigido por Newton (derivada automática). Quando ``intervalo``
+    é dado, f(a; p)·f(b; p) é verificado a cada ponto e a falsa posição é usada
+    como reserva enquanto houver mudança de sinal; raízes fora de [a, b] não
+    contam como sucesso (o ramo saiu do intervalo). Uma troca de sinal de f'(x)
+    entre raízes vizinhas, um salto do corretor muito maior que o último passo
+    (troca de ramo) ou a falha do corretor marcam um ponto de retorno (dobra) e
+    reiniciam a extrapolação a partir da última raiz encontrada.
+    """
+    valores = np.asarray(valores, dtype=float)
+    if valores.ndim != 1 or valores.size == 0:
+        raise RootFindingError("Informe ao menos um valor para o parâmetro.")
+    f = construir_funcao(expr, (parametro,))
+    f_df = construir_derivada(expr, (parametro,))
+
+    n = valores.size
+    raizes = np.full(n, np.nan)
+    fx = np.full(n, np.nan)
+    dfx = np.full(n, np.nan)
+    iteracoes = np.zeros(n, dtype=int)
+    sucesso = np.zeros(n, dtype=bool)
+    pontos_de_retorno = np.zeros(n, dtype=bool)
+    intervalo_perdido = np.zeros(n, dtype=bool)
+
+    historico: List[Tuple[float, float]] = []
+    for i, p in enumerate(valores):
+        if len(historico) >= 2 and historico[-1][0] != historico[-2][0]:
+            (p0, r0), (p1, r1) = historico[-2], historico[-1]
+            previsao = r1 + (r1 - r0) * (p - p1) / (p1 - p0)
+        elif historico:
+            previsao = historico[-1][1]
+        else:
+            previsao = x0
+
+        result = None
+        try:
+            result = newton(lambda x: f_df(x, p), previsao, tol, max_iter)
+        except _FALHAS_DE_CORRECAO:
+            pass
+
+        if intervalo is not None:
+            a, b = intervalo
+            try:
+                intervalo_perdido[i] = not f(a, p) * f(b, p) <= 0
+            except _FALHAS_DE_CORRECAO:
+                intervalo_perdido[i] = True
+            fora = result is None or not result["sucesso"] or not min(a, b) <= result["raiz"] <= max(a, b)
+            if fora and not intervalo_perdido[i]:
+                try:
+                    result = falsa_posicao(lambda x: f(x, p), a, b, tol, max_iter)
+                except _FALHAS_DE_CORRECAO:
+                    pass
+            if result is not None and result["sucesso"] and not min(a, b) <= result["raiz"] <= max(a, b):
+                iteracoes[i] = result["iteracoes"]
+                continue
+
+        if result is None or not result["sucesso"]:
+            pontos_de_retorno[i] = True
+            historico = historico[-1:]
+            if result is not None:
+                iteracoes[i] = result["iteracoes"]
+            continue
+
+        raizes[i] = result["raiz"]
+        try:
+            fx[i], dfx[i] = f_df(raizes[i], p)
+        except _FALHAS_DE_CORRECAO:
+            fx[i] = result["fx"]
+        iteracoes[i] = result["iteracoes"]
+        sucesso[i] = True
+        anterior = dfx[:i][sucesso[:i]]
+        troca_de_sinal = anterior.size and np.sign(anterior[-1]) * np.sign(dfx[i]) < 0
+        salto = False
+        if len(historico) >= 2:
+            ultimo_passo = abs(historico[-1][1] - historico[-2][1])
+            salto = abs(raizes[i] - previsao) > _SALTO_MAXIMO * ultimo_passo + 10 * tol
+        if troca_de_sinal or salto:
+            pontos_de_retorno[i] = True
+            historico = []
+        historico.append((p, raizes[i]))
+
+    return {
+        "parametros": valores,
+        "raizes": raizes,
+        "fx": fx,
+        "dfx": dfx,
+        "iteracoes": iteracoes,
+        "sucesso": sucesso,
+        "pontos_de_retorno": pontos_de_retorno,
+        "intervalo_perdido": intervalo_perdido,
+    }
@@ -0,0 +1,187 @@
+import io
+
+import numpy as np
+import pytest
+
+from methods.gaussian import (
+    CHECKPOINTS_MAXIMOS,
+    GaussianEliminationError,
+    _decompor_alteracao,
+    carregar_traco,
+    eliminacao_gauss_pivoteamento_parcial,
+    fatoracao_lu,
+    gravar_traco,
+    passos_do_traco,
+    resolver_incremental,
+)
+
+
+def test_traco_gravado_sem_instantaneos_reconstroi_os_passos():
+    n = 40
+    A = np.random.default_rng(0).normal(size=(n, n))
+    b = np.ones(n)
+    arquivo = io.BytesIO()
+    gravar_traco(A, b, arquivo)
+
+    with np.load(io.BytesIO(arquivo.getvalue())) as dados:
+        assert not any(nome.startswith("checkpoints") for nome in dados.files)
+
+    traco = carregar_traco(io.BytesIO(arquivo.getvalue()))
+    assert 0 < traco["checkpoints"].size <= CHECKPOINTS_MAXIMOS
+    referencia = next(v for v in eliminacao_gauss_pivoteamento_parcial(A, b) if isinstance(v, list))
+    meio = traco["codigos"].size // 2
+    for obtido, esperado in zip(passos_do_traco(traco, meio, meio + 20), referencia[meio : meio + 20]):
+        assert obtido["titulo"] == esperado["titulo"]
+        np.testing.assert_allclose(obtido["A"], esperado["A"])
+        np.testing.assert_allclose(obtido["b"], esperado["b"])
+
+
+class _Parar(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    "resolver",
+    [
+        lambda A, b, cb: gravar_traco(A, b, io.BytesIO(), ao_avancar=cb),
+        lambda A, b, cb: fatoracao_lu(A, ao_avancar=cb),
+    ],
+)
+def test_ao_avancar_informa_colunas_e_interrompe_a_eliminacao(resolver):
+    A = np.random.default_rng(1).normal(size=(30, 30))
+    colunas = []
+
+    def _ao_avancar(k):
+        colunas.append(k)
+        if k == 5:
+            raise _Parar
+
+    with pytest.raises(_Parar):
+        resolver(A, np.ones(30), _ao_avancar)
+    assert colunas == list(range(6))
+
+
+def _sistema(n=12, semente=3, dtype=np.float64):
+    rng = np.random.default_rng(semente)
+    return rng.normal(size=(n, n)).astype(dtype), rng.normal(size=n), rng
+
+
+@pytest.mark.parametrize(
+    "editar, posto",
+    [
+        (lambda delta, rng: delta.__setitem__(4, rng.normal(size=delta.shape[1])), 1),
+        (lambda delta, rng: delta.__setitem__((slice(None), 7), rng.normal(size=delta.shape[0])), 1),
+        (
+            lambda delta, rng: (
+                delta.__setitem__(2, rng.normal(size=delta.shape[1])),
+                delta.__setitem__((slice(None), 9), rng.normal(size=delta.shape[0])),
+            ),
+            2,
+        ),
+    ],
+    ids=["linha", "coluna", "linha-e-coluna"],
+)
+def test_decompor_alteracao_cobre_com_o_menor_posto(editar, posto):
+    delta = np.zeros((12, 12))
+    editar(delta, np.random.default_rng(0))
+
+    U, Vt = _decompor_alteracao(delta, delta != 0)
+
+    assert U.shape == (12, posto) and Vt.shape == (posto, 12)
+    np.testing.assert_allclose(U @ Vt, delta)
+
+
+def test_resolver_incremental_reusa_e_atualiza_a_fatoracao():
+    A, b, rng = _sistema()
+    x, fatoracao, info = resolver_incremental(A, b)
+    assert info["modo"] == "refatoracao"
+    np.testing.assert_allclose(A @ x, b, atol=1e-10)
+
+    _, _, info = resolver_incremental(A.copy(), b, fatoracao)
+    assert info["modo"] == "reuso"
+
+    A2 = A.copy()
+    A2[2] = rng.normal(size=12)
+    A2[:, 9] += rng.normal(size=12)
+    x, mesma, info = resolver_incremental(A2, b, fatoracao, max_posto=2)
+    assert info == {"modo": "atualizacao", "posto": 2, "motivo": None}
+    assert mesma is fatoracao
+    np.testing.assert_allclose(x, np.linalg.solve(A2, b), rtol=1e-9)
+
+
+def test_resolver_incremental_aceita_atualizacao_em_float32():
+    A, b, rng = _sistema(n=20, dtype=np.float32)
+    _, fatoracao, _ = resolver_incremental(A, b)
+    A2 = A.copy()
+    A2[3] += rng.normal(size=20).astype(np.float32)
+
+    x, _, info = resolver_incremental(A2, b, fatoracao)
+
+    assert info["modo"] == "atualizacao"
+    np.testing.assert_allclose(A2 @ x, b, atol=1e-4)
+
+
+def test_resolver_incremental_refatora_quando_o_posto_e_alto():
+    A, b, rng = _sistema()
+    _, fatoracao, _ = resolver_incremental(A, b)
+    A2 = A.copy()
+    A2[[1, 6]] = rng.normal(size=(2, 12))
+
+    x, nova, info = resolver_incremental(A2, b, fatoracao, max_posto=1)
+
+    assert info["modo"] == "refatoracao" and "posto 2" in info["motivo"]
+    assert nova is not fatoracao
+    np.testing.assert_allclose(x, np.linalg.solve(A2, b), rtol=1e-9)
+
+
+def test_resolver_incremental_refatora_com_capacitancia_mal_condicionada():
+    A, b, rng = _sistema()
+    _, fatoracao, _ = resolver_incremental(A, b)
+    A2 = A.copy()
+    A2[3] = A2[5] + 1e-8 * rng.normal(size=12)
+
+    x, _, info = resolver_incremental(A2, b, fatoracao)
+
+    assert info["modo"] == "refatoracao" and "capacitância" in info["motivo"]
+    assert np.linalg.norm(A2 @ x - b) < 1e-6
+
+
+def test_resolver_incremental_rejeita_nova_matriz_singular():
+    A, b, _ = _sistema()
+    _, fatoracao, _ = resolver_incremental(A, b)
+    A2 = A.copy()
+    A2[3] = A2[5]
+
+    with pytest.raises(GaussianEliminationError):
+        resolver_incremental(A2, b, fatoracao)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.complex128])
+def test_eliminacao_sobrescreve_buffers_e_preserva_dtype(dtype):
+    A, b, _ = _sistema(n=8)
+    A, b = A.astype(dtype), b.astype(dtype)
+    esperado = np.linalg.solve(A, b)
+    out = np.empty(8, dtype=dtype)
+
+    _, Ar, br, x, _, ok = eliminacao_gauss_pivoteamento_parcial(
+        A, b, overwrite_a=True, overwrite_b=True, out=out, registrar_passos=False
+    )
+
+    assert ok
+    assert Ar is A and br is b and x is out
+    assert x.dtype == dtype
+    assert np.allclose(np.tril(A, -1), 0, atol=1e-5)
+    np.testing.assert_allclose(out, esperado, rtol=1e-3 if dtype == np.float32 else 1e-10)
+
+
+def test_eliminacao_recusa_sobrescrever_com_dtypes_misturados():
+    A, b, _ = _sistema(n=8)
+    A32 = A.astype(np.float32)
+    original = A32.copy()
+
+    with pytest.raises(GaussianEliminationError, match="overwrite_a"):
+        eliminacao_gauss_pivoteamento_parcial(A32, b, overwrite_a=True)
+    np.testing.assert_array_equal(A32, original)
+
+    *_, x, _, ok = eliminacao_gauss_pivoteamento_parcial(A32, b)
+    assert ok and x.dtype == np.float64
@@ -0,0 +1,196 @@
+import math
+import threading
+
+import numpy as np
+import pytest
+
+from methods.root_finding import (
+    RootFindingError,
+    _resolver_nome,
+    construir_derivada,
+    construir_funcao,
+    falsa_posicao,
+    newton,
+    portfolio,
+    raizes_polinomio,
+    steffensen,
+    varredura_parametro,
+)
+
+
+def test_portfolio_ignora_metodo_estagnado_em_regiao_plana():
+    # A secante para por passo pequeno em x ≈ -1.8, onde f(x) ≈ -4.8; não pode vencer.
+    result = portfolio("exp(x) - 5", -3.0, 4.0)
+
+    assert result["sucesso"]
+    assert abs(result["fx"]) <= 1e-6
+    assert math.isclose(result["raiz"], math.log(5), rel_tol=1e-6)
+    assert result["tentativas"][result["metodo"]] == "venceu"
+
+
+def test_portfolio_nao_declara_vencedor_estagnado():
+    result = portfolio("exp(x) - 5", -3.0, 4.0, metodos=("Secante",))
+
+    assert not result["sucesso"]
+    assert result["tentativas"] == {"Secante": "estagnou"}
+
+
+def test_polinomio_escalar_usa_floats_e_array_usa_horner_vetorizado():
+    f = construir_funcao("x**3 - x - 2")
+
+    assert f.coeficientes is not None
+    assert type(f(1.5)) is float and f(1.5) == 1.5**3 - 1.5 - 2
+    np.testing.assert_allclose(f(np.array([1.0, 2.0])), [-2.0, 4.0])
+
+
+def test_varredura_marca_erro_de_dominio_do_corretor_como_ponto_de_retorno():
+    result = varredura_parametro("sqrt(x) - p", "p", np.linspace(2, -1, 7), x0=4.0)
+
+    np.testing.assert_allclose(result["raizes"][:2], [4.0, 2.25], rtol=1e-6)
+    assert not result["sucesso"][-1]
+    assert result["pontos_de_retorno"][~result["sucesso"]].all()
+
+
+@pytest.mark.parametrize(
+    "expr, x",
+    [
+        ("sqrt(x) - 1", -1.0),
+        ("log(x)", -2.0),
+        ("hypot(x, 1) - 2", 1.0),
+        ("sqrt(x) - 1", 0.0),
+        ("x**0.5", 0.0),
+        ("exp(x) - 5", 1000.0),
+        ("x**(1/3) - 2", -1.0),
+    ],
+)
+def test_derivada_automatica_converte_erros_em_root_finding_error(expr, x):
+    with pytest.raises(RootFindingError):
+        construir_derivada(expr)(x)
+
+
+@pytest.mark.parametrize(
+    "expr, derivada",
+    [
+        ("x**3 - 2*x", lambda x: 3 * x**2 - 2),
+        ("sin(x) * exp(x)", lambda x: (math.cos(x) + math.sin(x)) * math.exp(x)),
+        ("np.log(x) / x", lambda x: (1 - math.log(x)) / x**2),
+        ("2**x + x**x", lambda x: math.log(2) * 2**x + x**x * (math.log(x) + 1)),
+        ("sqrt(1 + x*x) - arctan(x)", lambda x: x / math.sqrt(1 + x * x) - 1 / (1 + x * x)),
+        ("abs(x - 3) + log10(x)", lambda x: -1 + 1 / (x * math.log(10))),
+    ],
+)
+def test_derivada_automatica_confere_com_a_analitica(expr, derivada):
+    f = construir_funcao(expr)
+    f_df = construir_derivada(expr)
+    for x in (0.5, 1.3, 2.7):
+        fx, dfx = f_df(x)
+        assert math.isclose(fx, f(x), rel_tol=1e-12)
+        assert math.isclose(dfx, derivada(x), rel_tol=1e-10)
+
+
+@pytest.mark.parametrize(
+    "expr, x0, raiz", [("x**3 - x - 2", 1.5, 1.5213797068045676), ("cos(x) - x", 1.0, 0.7390851332151607)]
+)
+def test_newton_e_steffensen_convergem(expr, x0, raiz):
+    por_newton = newton(construir_derivada(expr), x0, 1e-12, 50)
+    por_steffensen = steffensen(construir_funcao(expr), x0, 1e-12, 50)
+
+    for resultado in (por_newton, por_steffensen):
+        assert resultado["sucesso"]
+        assert math.isclose(resultado["raiz"], raiz, rel_tol=1e-10)
+    assert por_newton["iteracoes"] <= 8
+
+
+def test_portfolio_e_reprodutivel():
+    resultados = {(r["metodo"], r["raiz"]) for r in (portfolio("x**3 - x - 2", 1.0, 2.0) for _ in range(50))}
+
+    assert len(resultados) == 1
+
+
+def test_portfolio_interrompido_por_evento_externo():
+    interromper = threading.Event()
+    interromper.set()
+    with pytest.raises(RootFindingError, match="interrompido"):
+        portfolio("x**2 - 2", 0.0, 2.0, interromper=interromper)
+
+
+def test_polinomio_fatorado_de_grau_alto_nao_e_expandido():
+    f = construir_funcao("(x-10)**20 - 1")
+
+    assert f.coeficientes is None
+    assert f(11.0) == 0.0
+    assert math.isclose(f(10.5), 0.5**20 - 1)
+    assert falsa_posicao(f, 10.5, 11.5)["fx"] < 0
+    resultado = newton(construir_derivada("(x-10)**20 - 1"), 11.5, 1e-9, 100)
+    assert resultado["sucesso"]
+    assert math.isclose(resultado["raiz"], 11.0, rel_tol=1e-9)
+
+
+def test_raizes_polinomio_encontra_raizes_reais_e_complexas():
+    # (x - 1)(x + 2)(x² + 1)
+    raizes = raizes_polinomio(np.array([1.0, 1.0, -1.0, 1.0, -2.0]))
+
+    esperadas = np.array([-2.0, -1j, 1j, 1.0])
+    np.testing.assert_allclose(np.sort_complex(raizes), np.sort_complex(esperadas), atol=1e-10)
+
+
+def test_varredura_continua_um_ramo_com_partida_aquecida():
+    valores = np.linspace(1.0, 4.0, 13)
+    r = varredura_parametro("x**2 - p", "p", valores, x0=1.0)
+
+    assert r["sucesso"].all()
+    assert not r["pontos_de_retorno"].any()
+    np.testing.assert_allclose(r["raizes"], np.sqrt(valores), atol=1e-8)
+    # A previsão extrapolada já cai perto da raiz: poucas correções por ponto.
+    assert r["iteracoes"][1:].max() <= 3
+
+
+def test_varredura_marca_troca_de_sinal_da_derivada():
+    # Ao longo do ramo x = p, f'(x) = p - 1 muda de sinal ao cruzar o outro ramo x = 1.
+    valores = np.linspace(0.05, 1.95, 20)
+    r = varredura_parametro("(x - p)*(x - 1)", "p", valores, x0=0.0)
+
+    assert not r["pontos_de_retorno"][:10].any()
+    assert r["pontos_de_retorno"][10]
+    assert math.isclose(r["raizes"][10], 1.05, rel_tol=1e-6)
+    assert r["dfx"][9] < 0 < r["dfx"][10]
+
+
+def test_varredura_marca_salto_de_ramo():
+    # O ramo inferior de x³ - x = p termina em p ≈ 0.385; o corretor salta para o ramo superior.
+    valores = np.linspace(-1.0, 1.0, 9)
+    r = varredura_parametro("x**3 - x - p", "p", valores, x0=-1.5)
+
+    assert r["sucesso"].all()
+    assert (r["raizes"][:6] < 0).all() and (r["raizes"][6:] > 1).all()
+    assert r["dfx"][5] > 0 and r["dfx"][6] > 0
+    np.testing.assert_array_equal(r["pontos_de_retorno"], np.arange(9) == 6)
+
+
+def test_varredura_nao_aceita_raiz_fora_do_intervalo():
+    valores = np.linspace(-0.5, 1.0, 7)
+    r = varredura_parametro("x**3 - x - p", "p", valores, x0=-1.0, intervalo=(-2.0, 0.0))
+
+    dentro = r["sucesso"]
+    assert ((r["raizes"][dentro] >= -2.0) & (r["raizes"][dentro] <= 0.0)).all()
+    assert not dentro[valores > 0.4].any()
+    assert dentro[valores < 0.3].all()
+
+
+def test_namespace_preguicoso_resolve_como_o_namespace_completo():
+    completo = {nome: getattr(math, nome) for nome in dir(math) if not nome.startswith("_")}
+    completo.update({nome: getattr(np, nome) for nome in dir(np) if not nome.startswith("_")})
+    completo.update({"np": np, "math": math})
+
+    for nome in ("pi", "e", "abs", "sin", "sqrt", "log", "inf", "factorial", "hypot", "np", "math"):
+        assert _resolver_nome(nome) is completo[nome]
+    f = construir_funcao("np.sin(x) + abs(x) - pi + e + math.factorial(3)")
+    assert math.isclose(f(-1.0), math.sin(-1.0) + 1.0 - math.pi + math.e + 6)
+
+
+def test_namespace_preguicoso_recusa_nomes_desconhecidos_e_privados():
+    with pytest.raises(NameError):
+        construir_funcao("x + nao_existe")(1.0)
+    with pytest.raises(NameError):
+        construir_funcao("__import__")(1.0)
+    assert _resolver_nome.cache_info().maxsize == 1024